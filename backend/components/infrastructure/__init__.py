@@ -16,12 +16,22 @@ Main entry point: get_infrastructure_score()
 
 from .google_maps import GoogleMapsAPI
 from .scorer import InfrastructureScorer
+from functools import lru_cache
 from typing import Dict, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4)
+def _get_maps_api(api_key: str) -> GoogleMapsAPI:
+    """
+    Return a shared GoogleMapsAPI per key so repeat calls reuse its
+    HTTP connection pool and response cache instead of rebuilding them.
+    """
+    return GoogleMapsAPI(api_key=api_key)
+
+
 def get_infrastructure_score(
     locality: str,
     city: str,
@@ -54,7 +64,7 @@ def get_infrastructure_score(
         return 50.0, ["Infrastructure analysis unavailable — no API key"]
 
     try:
-        maps_api = GoogleMapsAPI(api_key=api_key)
+        maps_api = _get_maps_api(api_key)
         scorer = InfrastructureScorer(maps_api=maps_api)
 
         score, insights, _ = scorer.analyze(locality, city)
@@ -82,7 +92,7 @@ def get_detailed_infrastructure(
         return {'score': 50.0, 'insights': ["No API key"], 'component_scores': {}}
 
     try:
-        maps_api = GoogleMapsAPI(api_key=api_key)
+        maps_api = _get_maps_api(api_key)
         scorer = InfrastructureScorer(maps_api=maps_api)
 
         score, insights, detailed = scorer.analyze(locality, city)
@@ -0,0 +1,126 @@
+"""
+Maps Response Cache
+On-disk cache for Google Maps API results so repeat analyses skip the network.
+"""
+
+import hashlib
+import logging
+import shelve
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = '.mapcache'
+DEFAULT_TTL_S = 30 * 24 * 3600   # Google Maps ToS allows caching for up to 30 days
+DEFAULT_MEMORY_SIZE = 1024        # entries kept in the in-memory LRU layer
+
+
+class MapsCache:
+    """
+    Small TTL cache backed by shelve, with a bounded in-memory LRU in front.
+
+    Entries are stored as (stored_at, value) and dropped once older than ttl_s.
+    Safe to share between the threads that fan out Places lookups.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        path: str = DEFAULT_CACHE_PATH,
+        ttl_s: int = DEFAULT_TTL_S,
+        memory_size: int = DEFAULT_MEMORY_SIZE
+    ):
+        """
+        Args:
+            api_key: Google Maps key — hashed into every cache key so results
+                     never leak between different keys
+            path: shelve file path
+            ttl_s: Entry lifetime in seconds
+            memory_size: Max entries held in memory (least recently used go first)
+        """
+        self.ttl_s = ttl_s
+        self.memory_size = memory_size
+        self._namespace = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+        try:
+            self._db = shelve.open(path)
+        except Exception as e:
+            logger.warning(f"Could not open maps cache at {path}: {e} — using memory only")
+            self._db = None
+
+        self.expire()
+
+    def make_key(self, *parts: Any) -> str:
+        """Build a cache key from the API key namespace plus the given parts."""
+        return '|'.join([self._namespace, *(str(p) for p in parts)])
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing/expired."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+            elif self._db is not None:
+                entry = self._db.get(key)
+                if entry is not None:
+                    self._remember(key, entry)
+
+            if entry is None:
+                return None
+
+            stored_at, value = entry
+            if time.time() - stored_at > self.ttl_s:
+                self._delete(key)
+                return None
+
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value under key with the current timestamp."""
+        entry = (time.time(), value)
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is not None:
+                self._db[key] = entry
+                self._db.sync()
+
+    def expire(self) -> int:
+        """
+        Remove all expired entries from disk.
+
+        Returns:
+            Number of entries removed
+        """
+        if self._db is None:
+            return 0
+
+        now = time.time()
+        with self._lock:
+            stale = [
+                key for key in list(self._db.keys())
+                if now - self._db[key][0] > self.ttl_s
+            ]
+            for key in stale:
+                self._delete(key)
+            if stale:
+                self._db.sync()
+
+        return len(stale)
+
+    def _remember(self, key: str, entry: tuple) -> None:
+        """Put entry in the memory layer, evicting the LRU one if full (caller holds the lock)."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _delete(self, key: str) -> None:
+        """Drop key from both layers (caller holds the lock)."""
+        self._memory.pop(key, None)
+        if self._db is not None and key in self._db:
+            del self._db[key]
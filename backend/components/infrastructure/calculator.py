@@ -5,10 +5,22 @@ Handles distance calculations and radius-based checks for infrastructure scoring
 
 import math
 import logging
+import numpy as np
 from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+EARTH_RADIUS_M = 6371000  # Earth radius in meters
+
+# dtype for the vectorized distance path — float32 keeps Haversine accurate
+# to ~1m, far below the 500-8000m radii scored here, at half the memory
+COORD_DTYPE = np.float32
+
+# Count score lookup — more options = better.
+# 0 → 0, 1 → 50, 2-3 → 75, 4-6 → 90, 7+ → 100
+_COUNT_BUCKETS = np.array([0, 1, 3, 6])
+_COUNT_SCORES = np.array([0.0, 50.0, 75.0, 90.0, 100.0])
+
 # Infrastructure categories and their Google Places types
 INFRASTRUCTURE_TYPES = {
     'metro': {
@@ -50,6 +62,54 @@ INFRASTRUCTURE_TYPES = {
 }
 
 
+def _haversine_scalar(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """
+    Scalar Haversine kernel shared by the calculator's per-point calls.
+
+    Uses asin(sqrt(a)) rather than atan2(sqrt(a), sqrt(1 - a)) — same result,
+    one less sqrt — and binds the math functions locally.
+    """
+    radians, sin, cos = math.radians, math.sin, math.cos
+
+    phi1 = radians(lat1)
+    phi2 = radians(lat2)
+    sin_dphi = sin((phi2 - phi1) / 2)
+    sin_dlambda = sin(radians(lng2 - lng1) / 2)
+
+    a = sin_dphi * sin_dphi + cos(phi1) * cos(phi2) * sin_dlambda * sin_dlambda
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(min(a, 1.0)))
+
+
+# Frozen view of INFRASTRUCTURE_TYPES for the scoring hot path, with the
+# interpolation span pre-inverted: (key, weight, ideal_radius_m, max_radius_m, inv_span)
+_INFRA_CFG = tuple(
+    (
+        key,
+        cfg['weight'],
+        cfg['ideal_radius_m'],
+        cfg['max_radius_m'],
+        1.0 / (cfg['max_radius_m'] - cfg['ideal_radius_m'])
+    )
+    for key, cfg in INFRASTRUCTURE_TYPES.items()
+)
+_INFRA_INDEX = {cfg[0]: i for i, cfg in enumerate(_INFRA_CFG)}
+_DEFAULT_INFRA_CFG = (None, 0.1, 2000, 5000, 1.0 / 3000)
+
+
+def _interpolated_score(
+    distance_m: float,
+    ideal_radius_m: float,
+    max_radius_m: float,
+    inv_span: float
+) -> float:
+    """distance_to_score with 1 / (max - ideal) supplied by the caller."""
+    if distance_m <= ideal_radius_m:
+        return 100.0
+    if distance_m >= max_radius_m:
+        return 0.0
+    return round(100.0 - 100.0 * (distance_m - ideal_radius_m) * inv_span, 2)
+
+
 class ProximityCalculator:
     """
     Calculates proximity-based scores for infrastructure points.
@@ -67,20 +127,106 @@ class ProximityCalculator:
         Returns:
             Distance in meters
         """
-        R = 6371000  # Earth radius in meters
+        return _haversine_scalar(lat1, lng1, lat2, lng2)
 
-        phi1 = math.radians(lat1)
-        phi2 = math.radians(lat2)
-        dphi = math.radians(lat2 - lat1)
-        dlambda = math.radians(lng2 - lng1)
+    @staticmethod
+    def haversine_vector(
+        center_lat: float, center_lng: float,
+        lats: np.ndarray, lngs: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized Haversine — distances from one center to many coordinates.
+
+        Args:
+            center_lat, center_lng: Center point
+            lats, lngs: Arrays of latitudes / longitudes
+
+        Returns:
+            Array of distances in meters (same shape and dtype as lats)
+        """
+        phi1 = math.radians(center_lat)
+        return ProximityCalculator.haversine_from_precomputed(
+            phi1, math.cos(phi1), center_lng, lats, lngs
+        )
+
+    @staticmethod
+    def haversine_from_precomputed(
+        phi1: float, cos_phi1: float, lng1: float,
+        lats: np.ndarray, lngs: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized Haversine with the center's radians/cosine already computed.
+
+        Lets callers that measure many point sets from the same center
+        (one per infrastructure category) do the center trig only once.
+
+        Args:
+            phi1: Center latitude in radians
+            cos_phi1: cos(phi1)
+            lng1: Center longitude in degrees
+            lats, lngs: Arrays of latitudes / longitudes
+
+        Returns:
+            Array of distances in meters (same shape and dtype as lats)
+        """
+        phi2 = np.radians(lats)
+        dphi = phi2 - phi1
+        dlambda = np.radians(lngs - lng1)
 
         a = (
-            math.sin(dphi / 2) ** 2 +
-            math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+            np.sin(dphi / 2) ** 2 +
+            cos_phi1 * np.cos(phi2) * np.sin(dlambda / 2) ** 2
         )
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+        # Rounding can push `a` slightly past 1 in single precision — clamp so
+        # sqrt never sees a negative
+        return 2 * EARTH_RADIUS_M * np.arctan2(np.sqrt(a), np.sqrt(np.maximum(1 - a, 0)))
+
+    @staticmethod
+    def place_coordinates(places: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Stack place coordinates into (lats, lngs) COORD_DTYPE arrays.
+        """
+        lats = np.fromiter((p['lat'] for p in places), dtype=COORD_DTYPE, count=len(places))
+        lngs = np.fromiter((p['lng'] for p in places), dtype=COORD_DTYPE, count=len(places))
+        return lats, lngs
+
+    @staticmethod
+    def within_bbox(
+        center_lat: float, center_lng: float,
+        lats: np.ndarray, lngs: np.ndarray,
+        radius_m: float,
+        cos_center_lat: Optional[float] = None
+    ) -> np.ndarray:
+        """
+        Cheap pre-filter: mask of points inside the lat/lng box enclosing the
+        radius circle. Uses only subtraction + comparison per point, so the
+        Haversine only needs to run on the survivors.
+
+        The box is conservative — every point within radius_m is inside it.
+
+        Args:
+            center_lat, center_lng: Center point
+            lats, lngs: Arrays of latitudes / longitudes
+            radius_m: Radius in meters
+            cos_center_lat: cos(radians(center_lat)) if already computed
+
+        Returns:
+            Boolean array, True for points inside the box
+        """
+        if cos_center_lat is None:
+            cos_center_lat = math.cos(math.radians(center_lat))
+
+        angular = radius_m / EARTH_RADIUS_M
+        dlat_deg = math.degrees(angular)
+
+        # Widest longitude span of the circle; near the poles it covers everything
+        sin_ratio = math.sin(angular) / cos_center_lat if cos_center_lat > 0 else 2.0
+        dlng_deg = math.degrees(math.asin(sin_ratio)) if sin_ratio < 1 else 180.0
+
+        dlng = np.abs(lngs - center_lng)
+        dlng = np.minimum(dlng, 360.0 - dlng)   # antimeridian wrap
 
-        return R * c
+        return (np.abs(lats - center_lat) <= dlat_deg) & (dlng <= dlng_deg)
 
     @staticmethod
     def distance_to_score(
@@ -106,12 +252,21 @@ class ProximityCalculator:
         """
         if distance_m <= ideal_radius_m:
             return 100.0
-        elif distance_m >= max_radius_m:
-            return 0.0
-        else:
-            # Linear interpolation
-            ratio = (distance_m - ideal_radius_m) / (max_radius_m - ideal_radius_m)
-            return round(100.0 * (1 - ratio), 2)
+        return _interpolated_score(
+            distance_m, ideal_radius_m, max_radius_m,
+            1.0 / (max_radius_m - ideal_radius_m)
+        )
+
+    @staticmethod
+    def count_to_score(count_in_radius):
+        """
+        Convert a facility count (or array of counts) to a 0-100 count score.
+
+        Returns:
+            float for a scalar count, array of scores for an array of counts
+        """
+        scores = _COUNT_SCORES[np.searchsorted(_COUNT_BUCKETS, count_in_radius, side='left')]
+        return float(scores) if np.ndim(scores) == 0 else scores
 
     def score_infrastructure_type(
         self,
@@ -130,27 +285,19 @@ class ProximityCalculator:
         Returns:
             Dict with 'score', 'distance_score', 'count_score', 'details'
         """
-        config = INFRASTRUCTURE_TYPES.get(infra_type, {})
-        ideal = config.get('ideal_radius_m', 2000)
-        max_r = config.get('max_radius_m', 5000)
+        idx = _INFRA_INDEX.get(infra_type)
+        _, _, ideal, max_r, inv_span = (
+            _INFRA_CFG[idx] if idx is not None else _DEFAULT_INFRA_CFG
+        )
 
         # Distance score (70% of total)
         if nearest_distance_m is None:
             distance_score = 0.0
         else:
-            distance_score = self.distance_to_score(nearest_distance_m, ideal, max_r)
+            distance_score = _interpolated_score(nearest_distance_m, ideal, max_r, inv_span)
 
         # Count score (30% of total) — more options = better
-        if count_in_radius == 0:
-            count_score = 0.0
-        elif count_in_radius == 1:
-            count_score = 50.0
-        elif count_in_radius <= 3:
-            count_score = 75.0
-        elif count_in_radius <= 6:
-            count_score = 90.0
-        else:
-            count_score = 100.0
+        count_score = self.count_to_score(count_in_radius)
 
         combined_score = (distance_score * 0.7) + (count_score * 0.3)
 
@@ -180,12 +327,10 @@ class ProximityCalculator:
         Returns:
             Count of places within radius
         """
-        count = 0
-        for place in places:
-            dist = self.haversine_distance(
-                center_lat, center_lng,
-                place['lat'], place['lng']
-            )
-            if dist <= radius_m:
-                count += 1
-        return count
\ No newline at end of file
+        if not places:
+            return 0
+
+        lats, lngs = self.place_coordinates(places)
+        mask = self.within_bbox(center_lat, center_lng, lats, lngs, radius_m)
+        dists = self.haversine_vector(center_lat, center_lng, lats[mask], lngs[mask])
+        return int((dists <= radius_m).sum())
@@ -5,10 +5,34 @@ Handles all Google Maps API interactions for infrastructure scoring.
 
 import googlemaps
 import logging
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 
+from .cache import MapsCache, DEFAULT_CACHE_PATH
+from .calculator import ProximityCalculator
+
 logger = logging.getLogger(__name__)
 
+# Max concurrent Places API requests (keeps us well under Google's QPS limits)
+MAX_PARALLEL_REQUESTS = 12
+
+# Keep-alive pool sized above the Places fan-out so parallel calls reuse connections
+CONNECTION_POOL_SIZE = 20
+
+# Client-side rate limit; googlemaps.Client throttles to this and retries
+# OVER_QUERY_LIMIT / 5xx responses with exponential backoff
+QUERIES_PER_SECOND = 50
+REQUEST_TIMEOUT_S = 5
+
+# Failures we degrade gracefully on — anything else is a bug and should raise
+API_ERRORS = (
+    googlemaps.exceptions.ApiError,
+    googlemaps.exceptions.Timeout,
+    googlemaps.exceptions.TransportError,
+)
+
 
 class GoogleMapsAPI:
     """
@@ -18,15 +42,29 @@ class GoogleMapsAPI:
     - Distance Matrix API: Calculate travel times
     """
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache_path: Optional[str] = DEFAULT_CACHE_PATH):
         """
         Initialize with Google Maps API key.
 
         Args:
             api_key: Google Maps API key (needs Geocoding, Places, Distance Matrix enabled)
+            cache_path: On-disk cache for geocode/places/distance results (None to disable)
         """
-        self.client = googlemaps.Client(key=api_key)
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=CONNECTION_POOL_SIZE,
+            pool_maxsize=CONNECTION_POOL_SIZE
+        )
+        session.mount('https://', adapter)
+
+        self.client = googlemaps.Client(
+            key=api_key,
+            requests_session=session,
+            queries_per_second=QUERIES_PER_SECOND,
+            timeout=REQUEST_TIMEOUT_S
+        )
         self.api_key = api_key
+        self.cache = MapsCache(api_key, path=cache_path) if cache_path else None
 
     def geocode_locality(self, locality: str, city: str) -> Optional[Dict]:
         """
@@ -39,6 +77,15 @@ class GoogleMapsAPI:
         Returns:
             Dict with 'lat', 'lng', 'formatted_address' or None if not found
         """
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.make_key(
+                'geocode', locality.strip().lower(), city.strip().lower()
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             query = f"{locality}, {city}, India"
             results = self.client.geocode(query)
@@ -48,13 +95,17 @@ class GoogleMapsAPI:
                 return None
 
             location = results[0]['geometry']['location']
-            return {
+            geocoded = {
                 'lat': location['lat'],
                 'lng': location['lng'],
                 'formatted_address': results[0].get('formatted_address', query)
             }
 
-        except Exception as e:
+            if cache_key:
+                self.cache.set(cache_key, geocoded)
+            return geocoded
+
+        except API_ERRORS as e:
             logger.error(f"Geocoding error for {locality}, {city}: {e}")
             return None
 
@@ -77,6 +128,16 @@ class GoogleMapsAPI:
         Returns:
             List of place dicts with name, location, rating
         """
+        # Round to ~11m grid cells so nearby repeat queries share an entry
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.make_key(
+                'places', round(lat, 4), round(lng, 4), place_type, radius
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             results = self.client.places_nearby(
                 location=(lat, lng),
@@ -96,12 +157,58 @@ class GoogleMapsAPI:
                     'place_id': place.get('place_id', '')
                 })
 
+            if cache_key:
+                self.cache.set(cache_key, places)
             return places
 
-        except Exception as e:
+        except API_ERRORS as e:
             logger.error(f"Places API error for type {place_type}: {e}")
             return []
 
+    def find_nearby_places_multi(
+        self,
+        lat: float,
+        lng: float,
+        radius_by_type: Dict[str, int]
+    ) -> Dict[str, List[Dict]]:
+        """
+        Find places for several Google Places types at once.
+
+        Each type is searched exactly once, concurrently — callers that need
+        the same type for several purposes should merge them into one entry
+        (with the largest radius) rather than re-querying.
+
+        Args:
+            lat: Latitude
+            lng: Longitude
+            radius_by_type: Google Places type → search radius in meters
+
+        Returns:
+            Dict of place type → list of place dicts (as find_nearby_places)
+        """
+        place_types = list(radius_by_type)
+        if not place_types:
+            return {}
+
+        def search(place_type):
+            # One bad type (e.g. an unexpected response shape) only costs that
+            # type's results — it mustn't abort the whole map() and analysis
+            try:
+                return self.find_nearby_places(
+                    lat, lng,
+                    place_type=place_type,
+                    radius=radius_by_type[place_type]
+                )
+            except Exception as e:
+                logger.error(f"Places search failed for type {place_type}: {e}")
+                return []
+
+        workers = min(MAX_PARALLEL_REQUESTS, len(place_types))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(search, place_types))
+
+        return dict(zip(place_types, results))
+
     def get_distance_matrix(
         self,
         origin: Tuple[float, float],
@@ -122,6 +229,17 @@ class GoogleMapsAPI:
         if not destinations:
             return []
 
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.make_key(
+                'distance_matrix', mode,
+                (round(origin[0], 4), round(origin[1], 4)),
+                tuple((round(d_lat, 4), round(d_lng, 4)) for d_lat, d_lng in destinations)
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             result = self.client.distance_matrix(
                 origins=[origin],
@@ -143,9 +261,11 @@ class GoogleMapsAPI:
                 else:
                     distances.append(None)
 
+            if cache_key:
+                self.cache.set(cache_key, distances)
             return distances
 
-        except Exception as e:
+        except API_ERRORS as e:
             logger.error(f"Distance Matrix API error: {e}")
             return [None] * len(destinations)
 
@@ -154,24 +274,56 @@ class GoogleMapsAPI:
         lat: float,
         lng: float,
         place_type: str,
-        max_radius: int = 10000
+        max_radius: int = 10000,
+        use_road_distance: bool = False,
+        with_duration: bool = False
     ) -> Optional[Dict]:
         """
         Find the single nearest place of a given type.
 
+        By default "nearest" is straight-line (Haversine) distance, computed
+        locally — no Distance Matrix call. Road distance is opt-in.
+
         Args:
             lat: Latitude
             lng: Longitude
             place_type: Google Places type
             max_radius: Max search radius in meters
+            use_road_distance: Rank up to 10 candidates by Distance Matrix road
+                               distance instead (one extra billed API call)
+            with_duration: With straight-line ranking, fetch road distance and
+                           travel time for the winner only
 
         Returns:
-            Dict with place info + distance, or None
+            Dict with place info + 'distance_m' (and Distance Matrix fields
+            when road distance/duration was requested), or None
         """
         places = self.find_nearby_places(lat, lng, place_type, radius=max_radius)
         if not places:
             return None
 
+        if use_road_distance:
+            return self._find_nearest_by_road(lat, lng, places)
+
+        lats, lngs = ProximityCalculator.place_coordinates(places)
+        dists = ProximityCalculator.haversine_vector(lat, lng, lats, lngs)
+        best = int(dists.argmin())
+        nearest = {**places[best], 'distance_m': float(dists[best])}
+
+        if with_duration:
+            dist_info = self.get_distance_matrix((lat, lng), [(nearest['lat'], nearest['lng'])])
+            if dist_info and dist_info[0]:
+                nearest.update(dist_info[0])
+
+        return nearest
+
+    def _find_nearest_by_road(
+        self,
+        lat: float,
+        lng: float,
+        places: List[Dict]
+    ) -> Optional[Dict]:
+        """Pick the nearest of up to 10 places by Distance Matrix road distance."""
         # Get distances to all found places
         destinations = [(p['lat'], p['lng']) for p in places[:10]]  # limit API calls
         distances = self.get_distance_matrix((lat, lng), destinations)
@@ -185,4 +337,4 @@ class GoogleMapsAPI:
                 min_dist = dist_info['distance_m']
                 nearest = {**place, **dist_info}
 
-        return nearest
\ No newline at end of file
+        return nearest
@@ -3,14 +3,28 @@ Infrastructure Scorer
 Orchestrates data collection and scoring for all infrastructure types.
 """
 
+import heapq
 import logging
+import math
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
 from .google_maps import GoogleMapsAPI
 from .calculator import ProximityCalculator, INFRASTRUCTURE_TYPES
+from .spatial_index import PlaceIndex
 
 logger = logging.getLogger(__name__)
 
+# Overall-assessment bands: score < 40, 40-60, 60-80, >= 80
+_INSIGHT_BANDS = np.array([40, 60, 80])
+_INSIGHT_MSGS = (
+    "Poor infrastructure connectivity (score: {}/100)",
+    "Moderate infrastructure — some gaps exist (score: {}/100)",
+    "Good infrastructure with room for improvement (score: {}/100)",
+    "Excellent infrastructure connectivity (score: {}/100)",
+)
+
 
 class InfrastructureScorer:
     """
@@ -38,18 +52,30 @@ class InfrastructureScorer:
         """
         data = {}
 
-        for infra_type, config in INFRASTRUCTURE_TYPES.items():
-            logger.info(f"Searching for {infra_type}...")
-            all_places = []
-
-            # Search for each Google Place type associated with this infra type
+        # One search per Google Place type, at the largest radius any category
+        # needs. No type is shared between INFRASTRUCTURE_TYPES categories
+        # today, so this saves no calls yet — it only guards against overlap
+        # if the config later lists a type under two categories
+        radius_by_type = {}
+        for config in INFRASTRUCTURE_TYPES.values():
             for place_type in config['place_types']:
-                places = self.maps.find_nearby_places(
-                    lat, lng,
-                    place_type=place_type,
-                    radius=config['max_radius_m']
+                radius_by_type[place_type] = max(
+                    radius_by_type.get(place_type, 0), config['max_radius_m']
                 )
-                all_places.extend(places)
+
+        logger.info(f"Searching {len(radius_by_type)} place types...")
+        places_by_type = self.maps.find_nearby_places_multi(lat, lng, radius_by_type)
+
+        # Center trig is the same for every category — compute it once
+        center_phi = math.radians(lat)
+        cos_center_phi = math.cos(center_phi)
+
+        for infra_type, config in INFRASTRUCTURE_TYPES.items():
+            all_places = [
+                place
+                for place_type in config['place_types']
+                for place in places_by_type.get(place_type, [])
+            ]
 
             # Deduplicate by place_id
             seen = set()
@@ -60,18 +86,30 @@ class InfrastructureScorer:
                     seen.add(pid)
                     unique_places.append(p)
 
-            # Find nearest via Haversine (avoids extra API calls)
+            # Nearest + count via vectorized Haversine (avoids extra API calls).
+            # Only places inside the radius bounding box need the exact distance;
+            # if none are within the radius, fall back to all places for nearest.
             nearest_dist = None
-            for place in unique_places:
-                dist = self.calculator.haversine_distance(
-                    lat, lng, place['lat'], place['lng']
+            count = 0
+            if unique_places:
+                max_r = config['max_radius_m']
+                lats, lngs = self.calculator.place_coordinates(unique_places)
+                mask = self.calculator.within_bbox(
+                    lat, lng, lats, lngs, max_r, cos_center_lat=cos_center_phi
+                )
+                dists = self.calculator.haversine_from_precomputed(
+                    center_phi, cos_center_phi, lng, lats[mask], lngs[mask]
                 )
-                if nearest_dist is None or dist < nearest_dist:
-                    nearest_dist = dist
+                in_radius = dists[dists <= max_r]
+                count = int(in_radius.size)
 
-            count = self.calculator.count_places_in_radius(
-                lat, lng, unique_places, config['max_radius_m']
-            )
+                if count:
+                    nearest_dist = float(in_radius.min())
+                else:
+                    dists = self.calculator.haversine_from_precomputed(
+                        center_phi, cos_center_phi, lng, lats, lngs
+                    )
+                    nearest_dist = float(dists.min())
 
             data[infra_type] = {
                 'places': unique_places,
@@ -97,6 +135,26 @@ class InfrastructureScorer:
             )
         return scores
 
+    def count_in_radius_batch(
+        self,
+        centers: List[Tuple[float, float]],
+        infra_data: Dict[str, Dict]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Count each type's collected places around many (lat, lng) centers.
+
+        Builds one K-D tree per infrastructure type, so scoring M localities
+        against the same places costs O(M log N) rather than O(M·N).
+
+        Returns:
+            Dict of infra type → int array of counts, one per center
+        """
+        counts = {}
+        for infra_type, data in infra_data.items():
+            radius = INFRASTRUCTURE_TYPES.get(infra_type, {}).get('max_radius_m', 5000)
+            counts[infra_type] = PlaceIndex(data['places']).count_within(centers, radius)
+        return counts
+
     def calculate_final_score(self, scores: Dict[str, Dict]) -> float:
         """
         Calculate weighted final infrastructure score (0-100).
@@ -126,20 +184,22 @@ class InfrastructureScorer:
         insights = []
 
         # Overall assessment
-        if final_score >= 80:
-            insights.append(f"Excellent infrastructure connectivity (score: {final_score}/100)")
-        elif final_score >= 60:
-            insights.append(f"Good infrastructure with room for improvement (score: {final_score}/100)")
-        elif final_score >= 40:
-            insights.append(f"Moderate infrastructure — some gaps exist (score: {final_score}/100)")
-        else:
-            insights.append(f"Poor infrastructure connectivity (score: {final_score}/100)")
-
-        # Specific highlights (best and worst)
-        sorted_scores = sorted(scores.items(), key=lambda x: x[1]['score'], reverse=True)
+        band = int(np.searchsorted(_INSIGHT_BANDS, final_score, side='right'))
+        insights.append(_INSIGHT_MSGS[band].format(final_score))
+
+        # Specific highlights (best and worst) — only the two at each end are
+        # needed. Both match the ends of a stable descending sort, ties included:
+        # nlargest keeps the earliest of tied items, and at the low end a stable
+        # sort puts the latest tied item last, hence the -index tie-breaker
+        strongest = heapq.nlargest(2, scores.items(), key=lambda x: x[1]['score'])
+        weakest = [
+            item for _, item in reversed(heapq.nsmallest(
+                2, enumerate(scores.items()), key=lambda x: (x[1][1]['score'], -x[0])
+            ))
+        ]
 
         # Top 2 strengths
-        for infra_type, score_data in sorted_scores[:2]:
+        for infra_type, score_data in strongest:
             dist = score_data.get('nearest_distance_m')
             count = score_data.get('count_in_radius', 0)
             dist_text = f"{int(dist)}m" if dist else "unknown distance"
@@ -148,7 +208,7 @@ class InfrastructureScorer:
             )
 
         # Top 2 weaknesses
-        for infra_type, score_data in sorted_scores[-2:]:
+        for infra_type, score_data in weakest:
             if score_data['score'] < 50:
                 dist = score_data.get('nearest_distance_m')
                 dist_text = f"{int(dist)}m away" if dist else "none found nearby"
@@ -161,7 +221,8 @@ class InfrastructureScorer:
     def analyze(
         self,
         locality: str,
-        city: str
+        city: str,
+        location: Optional[Dict] = None
     ) -> Tuple[float, List[str], Dict]:
         """
         Full analysis pipeline for a locality.
@@ -169,12 +230,15 @@ class InfrastructureScorer:
         Args:
             locality: Locality name
             city: City name
+            location: Precomputed geocode result ({'lat', 'lng', ...}) — pass
+                      it when other collectors already geocoded the locality
 
         Returns:
             (final_score, insights, detailed_data)
         """
-        # Step 1: Geocode
-        location = self.maps.geocode_locality(locality, city)
+        # Step 1: Geocode (skipped when the caller already has the location)
+        if location is None:
+            location = self.maps.geocode_locality(locality, city)
         if not location:
             logger.error(f"Could not geocode {locality}, {city}")
             return 50.0, ["Could not geocode locality — using neutral score"], {}
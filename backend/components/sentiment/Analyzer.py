@@ -3,34 +3,94 @@ Sentiment Analyzer
 Core sentiment analysis logic using VADER ML model.
 """
 
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-from typing import List, Dict, Tuple
+from typing import List, Dict, NamedTuple, Tuple
 import logging
 
+import numpy as np
+
+from .Vader import CompoundVader
+
 logger = logging.getLogger(__name__)
 
+# VADER's cost grows faster than linearly on long, emoji-heavy text — score
+# only the opening of each post (title + lead), where the opinion usually is
+MAX_TEXT_CHARS = 500
+
+NEUTRAL_SCORES = {'compound': 0.0, 'pos': 0.0, 'neu': 1.0, 'neg': 0.0}
+
+# Loading the lexicon is the expensive part of VADER — do it once per process
+# and share it between every SentimentAnalyzer
+_VADER = CompoundVader()
+
+# Insight decision tables — np.searchsorted(bands, x, side='right') picks the message
+_MENTION_BANDS = np.array([1, 30, 100])
+_MENTION_MSGS = (
+    "No community mentions found — score defaulted to neutral",
+    "Limited data available ({} mentions found)",
+    "Moderate community engagement ({} mentions found)",
+    "High community engagement ({} mentions found)",
+)
+
+_SCORE_BANDS = np.array([45, 60, 75])
+_SCORE_MSGS = (
+    "Predominantly negative feedback — residents flag concerns",
+    "Mixed or neutral sentiment from the community",
+    "Generally positive feedback from residents",
+    "Residents express strongly positive feedback about this area",
+)
+
+_TREND_MSGS = {
+    'improving': "Sentiment has been improving recently",
+    'declining': "Sentiment shows a declining trend recently",
+}
+
+
+class PostArrays(NamedTuple):
+    """Struct-of-arrays view of analyzed posts — one float64 array per field."""
+    compounds: np.ndarray
+    upvotes: np.ndarray       # clamped to >= 1, ready to use as weights
+    times: np.ndarray
+
+
+def _seq_sum(values: np.ndarray) -> float:
+    """
+    Left-to-right sum, rounding exactly like builtin sum() — np.sum's pairwise
+    summation can shift the 4th decimal of the reported metrics.
+    """
+    return float(np.cumsum(values)[-1]) if values.size else 0.0
+
+
+def _polarity(text: str) -> Dict:
+    """All four VADER scores for one text."""
+    if not text or not text.strip():
+        return dict(NEUTRAL_SCORES)
+    return _VADER.polarity_scores(text[:MAX_TEXT_CHARS])
+
+
+def _compound(text: str) -> float:
+    """Compound score only — all that scoring needs, at a fraction of the cost."""
+    if not text or not text.strip():
+        return NEUTRAL_SCORES['compound']
+    return _VADER.compound(text[:MAX_TEXT_CHARS])
+
 
 class SentimentAnalyzer:
     """Analyzes sentiment of locality-related posts using VADER."""
 
     def __init__(self):
-        self.vader = SentimentIntensityAnalyzer()
+        self.vader = _VADER
 
     def analyze_text(self, text: str) -> Dict:
         """
         Analyze sentiment of a single text.
 
         Args:
-            text: Text to analyze
+            text: Text to analyze (only the first MAX_TEXT_CHARS are scored)
 
         Returns:
             Dict with compound, pos, neu, neg scores
         """
-        if not text or not text.strip():
-            return {'compound': 0.0, 'pos': 0.0, 'neu': 1.0, 'neg': 0.0}
-
-        scores = self.vader.polarity_scores(text)
-        return scores
+        return _polarity(text)
 
     def analyze_posts(self, posts: List[Dict]) -> List[Dict]:
         """
@@ -42,15 +102,26 @@ class SentimentAnalyzer:
         Returns:
             Same posts with 'sentiment' key added
         """
-        analyzed = []
-        for post in posts:
-            text = post.get('text', '')
-            sentiment = self.analyze_text(text)
-            analyzed.append({
-                **post,
-                'sentiment': sentiment
-            })
-        return analyzed
+        sentiments = [_polarity(post.get('text', '')) for post in posts]
+
+        return [
+            {**post, 'sentiment': sentiment}
+            for post, sentiment in zip(posts, sentiments)
+        ]
+
+    def analyze_posts_arrays(self, posts: List[Dict]) -> PostArrays:
+        """
+        Like analyze_posts, but returns only the fields scoring needs as
+        parallel arrays instead of copying every post into a new dict.
+        """
+        compounds = [_compound(post.get('text', '')) for post in posts]
+
+        n = len(posts)
+        return PostArrays(
+            compounds=np.asarray(compounds, dtype=np.float64),
+            upvotes=np.fromiter((max(p.get('score', 1), 1) for p in posts), dtype=np.float64, count=n),
+            times=np.fromiter((p.get('created_utc', 0) for p in posts), dtype=np.float64, count=n),
+        )
 
     def calculate_score(
         self,
@@ -67,7 +138,34 @@ class SentimentAnalyzer:
         Returns:
             (score 0-100, metrics dict)
         """
-        if not analyzed_posts:
+        n = len(analyzed_posts)
+        return self.calculate_score_arrays(PostArrays(
+            compounds=np.fromiter(
+                (p['sentiment']['compound'] for p in analyzed_posts), dtype=np.float64, count=n
+            ),
+            upvotes=np.fromiter(
+                (max(p.get('score', 1), 1) for p in analyzed_posts), dtype=np.float64, count=n
+            ),
+            times=np.fromiter(
+                (p.get('created_utc', 0) for p in analyzed_posts), dtype=np.float64, count=n
+            ),
+        ), use_weighted)
+
+    def calculate_score_arrays(
+        self,
+        arrays: PostArrays,
+        use_weighted: bool = True
+    ) -> Tuple[float, Dict]:
+        """
+        calculate_score over a struct-of-arrays (see analyze_posts_arrays).
+
+        Returns:
+            (score 0-100, metrics dict)
+        """
+        compounds, upvotes, times = arrays
+        n = compounds.size
+
+        if not n:
             return 50.0, {
                 'avg_sentiment': 0.0,
                 'weighted_sentiment': 0.0,
@@ -76,26 +174,21 @@ class SentimentAnalyzer:
                 'trend': 'unknown'
             }
 
-        compounds = [p['sentiment']['compound'] for p in analyzed_posts]
-        upvotes = [max(p.get('score', 1), 1) for p in analyzed_posts]
-
         # Simple average sentiment
-        avg_sentiment = sum(compounds) / len(compounds)
+        avg_sentiment = _seq_sum(compounds) / n
 
         # Upvote-weighted sentiment
-        total_weight = sum(upvotes)
-        weighted_sentiment = (
-            sum(c * w for c, w in zip(compounds, upvotes)) / total_weight
-        )
-
-        # Recent sentiment (last 30% of posts by timestamp)
-        sorted_posts = sorted(analyzed_posts, key=lambda p: p.get('created_utc', 0))
-        recent_cutoff = max(1, int(len(sorted_posts) * 0.7))
-        recent_posts = sorted_posts[recent_cutoff:]
-        recent_sentiment = (
-            sum(p['sentiment']['compound'] for p in recent_posts) / len(recent_posts)
-            if recent_posts else avg_sentiment
-        )
+        weighted_sentiment = _seq_sum(compounds * upvotes) / _seq_sum(upvotes)
+
+        # Recent sentiment (last 30% of posts by timestamp). The sort must be
+        # stable: tied timestamps (or missing ones, defaulted to 0) keep input
+        # order, so the same posts count as "recent" as with sorted()
+        recent_cutoff = max(1, int(n * 0.7))
+        if recent_cutoff < n:
+            recent_idx = np.argsort(times, kind='stable')[recent_cutoff:]
+            recent_sentiment = _seq_sum(compounds[recent_idx]) / recent_idx.size
+        else:
+            recent_sentiment = avg_sentiment
 
         # Determine trend (recent vs overall)
         if recent_sentiment > avg_sentiment + 0.05:
@@ -119,7 +212,7 @@ class SentimentAnalyzer:
             'avg_sentiment': round(avg_sentiment, 4),
             'weighted_sentiment': round(weighted_sentiment, 4),
             'recent_sentiment': round(recent_sentiment, 4),
-            'mention_count': len(analyzed_posts),
+            'mention_count': n,
             'trend': trend
         }
 
@@ -140,30 +233,16 @@ class SentimentAnalyzer:
         weighted = metrics.get('weighted_sentiment', 0)
 
         # Mention count
-        if count >= 100:
-            insights.append(f"High community engagement ({count} mentions found)")
-        elif count >= 30:
-            insights.append(f"Moderate community engagement ({count} mentions found)")
-        elif count > 0:
-            insights.append(f"Limited data available ({count} mentions found)")
-        else:
-            insights.append("No community mentions found — score defaulted to neutral")
+        band = int(np.searchsorted(_MENTION_BANDS, count, side='right'))
+        insights.append(_MENTION_MSGS[band].format(count))
 
         # Overall sentiment
-        if score >= 75:
-            insights.append("Residents express strongly positive feedback about this area")
-        elif score >= 60:
-            insights.append("Generally positive feedback from residents")
-        elif score >= 45:
-            insights.append("Mixed or neutral sentiment from the community")
-        else:
-            insights.append("Predominantly negative feedback — residents flag concerns")
+        band = int(np.searchsorted(_SCORE_BANDS, score, side='right'))
+        insights.append(_SCORE_MSGS[band])
 
         # Trend
-        if trend == 'improving':
-            insights.append("Sentiment has been improving recently")
-        elif trend == 'declining':
-            insights.append("Sentiment shows a declining trend recently")
+        if trend in _TREND_MSGS:
+            insights.append(_TREND_MSGS[trend])
 
         # Engagement quality (popular posts vs average)
         if metrics.get('weighted_sentiment', 0) > metrics.get('avg_sentiment', 0) + 0.1:
@@ -190,8 +269,7 @@ def analyze_locality_sentiment(posts: List[Dict]) -> Tuple[float, List[str]]:
         logger.warning("No posts provided — returning neutral score")
         return 50.0, ["No community data available — defaulted to neutral score"]
 
-    analyzed = analyzer.analyze_posts(posts)
-    score, metrics = analyzer.calculate_score(analyzed)
+    score, metrics = analyzer.calculate_score_arrays(analyzer.analyze_posts_arrays(posts))
     insights = analyzer.generate_insights(score, metrics)
 
     return score, insights
\ No newline at end of file
@@ -9,13 +9,37 @@ When you get official Reddit API access later, swap this file with
 collector_praw.py and everything else stays the same.
 """
 
+import asyncio
+import heapq
+import orjson
+import re
 import requests
+import requests_cache
+import threading
 import time
 import logging
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from typing import FrozenSet, List, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+MAX_WORKERS = 8
+MIN_REQUEST_INTERVAL = 0.25   # seconds between requests, shared across all workers
+RATELIMIT_FLOOR = MAX_WORKERS  # pause for the reset once fewer requests than this remain
+
+MAX_CONNECTIONS = 16         # async client — HTTP/2 multiplexes these over few sockets
+
+# Transient upstream errors are retried at the adapter, with backoff
+RETRY = Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 502, 503),
+              respect_retry_after_header=True, raise_on_status=False)
+
+CACHE_NAME = 'reddit_cache'
+CACHE_EXPIRE_AFTER = 3600     # seconds — repeat runs within the hour skip the network
+
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (locality-rater research tool)'
 }
@@ -34,23 +58,179 @@ DEFAULT_SUBREDDITS = [
     'realestate',
 ]
 
-QUERY_TEMPLATES = [
-    '{locality} {city}',
-    '{locality} area',
-    'living in {locality}',
-    '{locality} review',
-]
+# All search intents OR'd into one query, so each subreddit needs a single request
+COMBINED_QUERY = (
+    '"{locality} {city}" OR "{locality} area" OR '
+    '"living in {locality}" OR "{locality} review"'
+)
+SEARCH_LIMIT = 100   # Reddit's max page size — one query now covers every intent
+
+# Subreddits searched together as one multireddit (r/a+b+c) per request.
+# Each request still returns at most SEARCH_LIMIT posts, so groups stay small
+# enough that a busy subreddit can't crowd the others out of the page.
+SUBREDDITS_PER_SEARCH = 4
+EARLY_STOP_HEADROOM = 2   # stop fetching once we hold this many times max_posts
+
+
+@dataclass(slots=True, frozen=True)
+class RedditPost:
+    """One search result. Slotted, since a collection run holds thousands."""
+    id: str
+    text: str
+    text_lower: str   # lowercased once at parse time for locality matching
+    score: int
+    created_utc: float
+    url: str
+    subreddit: str
+    num_comments: int
+    localities: FrozenSet[str] = frozenset()   # set by multi-locality filtering
+
+    # Fields handed downstream — the original post dict keys, all JSON-safe.
+    # text_lower and localities only matter for matching
+    EXPORT_FIELDS = ('id', 'text', 'score', 'created_utc', 'url', 'subreddit', 'num_comments')
+
+    def to_dict(self) -> Dict:
+        """
+        Shallow dict of the exported fields. Unlike dataclasses.asdict this
+        doesn't deep-copy every value.
+        """
+        return {f: getattr(self, f) for f in self.EXPORT_FIELDS}
+
+
+class LocalityMatcher:
+    """
+    Finds every locality variant in a text with a single regex scan, instead of
+    one substring search per variant.
+
+    The lookahead makes matches zero-width, so overlapping variants are all seen;
+    at any one position only the longest matches, so shorter variants contained
+    in a hit ("hsr" inside "hsr layout") are added back from the variant list.
+    """
+
+    def __init__(self, locality_variants):
+        self.variants = sorted({v.lower() for v in locality_variants}, key=len, reverse=True)
+        alternation = '|'.join(re.escape(v) for v in self.variants)
+        self._pattern = re.compile(f'(?=({alternation}))')
+
+    def find(self, text_lower):
+        """Return the set of variants mentioned in text_lower (already lowercased)."""
+        hits = {m.group(1) for m in self._pattern.finditer(text_lower)}
+        for hit in list(hits):
+            hits.update(v for v in self.variants if len(v) < len(hit) and v in hit)
+        return hits
+
+
+class RateLimiter:
+    """
+    Spaces out calls from many threads to at most one per interval, and
+    slows further only when Reddit's X-Ratelimit-* headers say the budget
+    is running low.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def _reserve(self):
+        """Claim the next slot and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            wait_for = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        return wait_for
+
+    def observe(self, headers):
+        """
+        Hold every caller until the window resets once X-Ratelimit-Remaining
+        drops below what could already be in flight; no-op without the headers.
+        """
+        try:
+            remaining = float(headers['x-ratelimit-remaining'])
+            reset_s = float(headers['x-ratelimit-reset'])
+        except (KeyError, TypeError, ValueError):
+            return
+        if remaining >= RATELIMIT_FLOOR:
+            return
+        logger.warning(f"Reddit rate budget low ({remaining:.0f} left) — pausing {reset_s:.0f}s")
+        with self._lock:
+            self._next_at = max(self._next_at, time.monotonic() + reset_s)
+
+    def wait(self):
+        wait_for = self._reserve()
+        if wait_for > 0:
+            time.sleep(wait_for)
+
+    async def wait_async(self):
+        wait_for = self._reserve()
+        if wait_for > 0:
+            await asyncio.sleep(wait_for)
 
 
 class RedditCollector:
     """Collects Reddit posts using public JSON endpoints. No API key needed."""
 
-    def __init__(self, credentials=None):
-        """credentials param kept for future PRAW compatibility but not used."""
-        self.session = requests.Session()
+    def __init__(self, credentials=None, cache_name=CACHE_NAME):
+        """
+        credentials param kept for future PRAW compatibility but not used.
+        cache_name is the on-disk (SQLite) response cache; None disables caching.
+        """
+        if cache_name:
+            self.session = requests_cache.CachedSession(
+                cache_name,
+                backend='sqlite',
+                expire_after=CACHE_EXPIRE_AFTER,
+                allowable_codes=(200,),
+                # Only searches are worth caching — a cached HEAD would make
+                # warm_up() a no-op that never opens a connection
+                allowable_methods=('GET',),
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update(HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS, max_retries=RETRY
+        )
+        self.session.mount('https://', adapter)
+        self.rate_limiter = RateLimiter(MIN_REQUEST_INTERVAL)
+        self._warmed_up = False
+
+    def warm_up(self):
+        """
+        Open a keep-alive connection to Reddit ahead of the fan-out, so the
+        first searches don't all pay the TCP + TLS handshake. Best effort.
+        """
+        if self._warmed_up:
+            return
+        self._warmed_up = True
+        try:
+            self.session.head('https://www.reddit.com/', timeout=5)
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Reddit warm-up failed: {e}")
+
+    def _get(self, url, params, bypass_cache=False, stop_event=None):
+        """
+        GET through the cache; only requests that hit the network are rate limited.
+        Returns None instead of going to the network once stop_event is set.
+        """
+        cached = isinstance(self.session, requests_cache.CachedSession)
+        if cached and not bypass_cache:
+            response = self.session.get(url, params=params, timeout=10, only_if_cached=True)
+            if response.status_code != 504:   # 504 = not in cache
+                return response
+
+        self.rate_limiter.wait()
+        if stop_event is not None and stop_event.is_set():
+            return None
+        if cached:
+            response = self.session.get(url, params=params, timeout=10, force_refresh=bypass_cache)
+        else:
+            response = self.session.get(url, params=params, timeout=10)
+        self.rate_limiter.observe(response.headers)
+        return response
 
-    def search_subreddit(self, subreddit, query, limit=25):
+    @staticmethod
+    def _search_request(subreddit, query, limit):
         url = f"https://www.reddit.com/r/{subreddit}/search.json"
         params = {
             'q': query,
@@ -59,32 +239,75 @@ class RedditCollector:
             't': 'year',
             'restrict_sr': 1,
         }
+        return url, params
+
+    @staticmethod
+    def _search_targets(subreddits):
+        """Join subreddits into multireddit names, SUBREDDITS_PER_SEARCH at a time."""
+        return [
+            '+'.join(subreddits[i:i + SUBREDDITS_PER_SEARCH])
+            for i in range(0, len(subreddits), SUBREDDITS_PER_SEARCH)
+        ]
+
+    @staticmethod
+    def _parse_posts(payload, subreddit, locality_filter=None, min_text_length=20):
+        posts = payload.get('data', {}).get('children', [])
+        results = []
+        for post in posts:
+            p = post.get('data', {})
+            text = f"{p.get('title', '')}. {p.get('selftext', '')}".strip()
+            text_lower = text.lower()
+            if locality_filter and locality_filter not in text_lower:
+                continue
+            if len(text) < min_text_length:
+                continue
+            results.append(RedditPost(
+                id=p.get('id', ''),
+                text=text,
+                text_lower=text_lower,
+                score=p.get('score', 0),
+                created_utc=p.get('created_utc', 0),
+                url=f"https://reddit.com{p.get('permalink', '')}",
+                subreddit=p.get('subreddit', subreddit),
+                num_comments=p.get('num_comments', 0),
+            ))
+        return results
+
+    @staticmethod
+    def _merge_posts(posts_by_id, posts):
+        """Dedup into posts_by_id, keeping the higher-scored copy of a repeated post."""
+        for post in posts:
+            pid = post.id
+            if not pid:
+                continue
+            best = posts_by_id.get(pid)
+            if best is None or post.score > best.score:
+                posts_by_id[pid] = post
+
+    def search_subreddit(self, subreddit, query, limit=25, bypass_cache=False,
+                         locality_filter=None, min_text_length=20, stop_event=None):
+        """
+        locality_filter (lowercase) drops posts that don't mention the locality
+        before they are built, along with anything shorter than min_text_length.
+        stop_event (threading.Event) skips the network once search_all has enough.
+        """
+        if stop_event is not None and stop_event.is_set():
+            return []
+
+        url, params = self._search_request(subreddit, query, limit)
         try:
-            response = self.session.get(url, params=params, timeout=10)
-            if response.status_code == 429:
+            response = self._get(url, params, bypass_cache, stop_event)
+            if response is not None and response.status_code == 429:
                 logger.warning("Rate limited — waiting 5 seconds...")
                 time.sleep(5)
-                response = self.session.get(url, params=params, timeout=10)
+                response = self._get(url, params, bypass_cache=True, stop_event=stop_event)
+            if response is None:
+                return []
             if response.status_code != 200:
                 logger.warning(f"r/{subreddit} returned status {response.status_code}")
                 return []
 
-            posts = response.json().get('data', {}).get('children', [])
-            results = []
-            for post in posts:
-                p = post.get('data', {})
-                text = f"{p.get('title', '')}. {p.get('selftext', '')}".strip()
-                results.append({
-                    'id': p.get('id', ''),
-                    'text': text,
-                    'score': p.get('score', 0),
-                    'created_utc': p.get('created_utc', 0),
-                    'url': f"https://reddit.com{p.get('permalink', '')}",
-                    'subreddit': subreddit,
-                    'num_comments': p.get('num_comments', 0),
-                })
-            time.sleep(0.5)
-            return results
+            return self._parse_posts(orjson.loads(response.content), subreddit, locality_filter, min_text_length)
 
         except requests.exceptions.Timeout:
             logger.warning(f"Timeout on r/{subreddit}")
@@ -93,37 +316,188 @@ class RedditCollector:
             logger.warning(f"Error on r/{subreddit}: {e}")
             return []
 
-    def search_all(self, locality, city, subreddits=None):
+    async def search_subreddit_async(self, client, subreddit, query, limit=25,
+                                     locality_filter=None, min_text_length=20):
+        """Async twin of search_subreddit, sharing one httpx.AsyncClient. Uncached."""
+        import httpx   # only the async path needs it — keep it off the import-time path
+        url, params = self._search_request(subreddit, query, limit)
+        try:
+            await self.rate_limiter.wait_async()
+            response = await client.get(url, params=params)
+            self.rate_limiter.observe(response.headers)
+            if response.status_code == 429:
+                logger.warning("Rate limited — waiting 5 seconds...")
+                await asyncio.sleep(5)
+                await self.rate_limiter.wait_async()
+                response = await client.get(url, params=params)
+                self.rate_limiter.observe(response.headers)
+            if response.status_code != 200:
+                logger.warning(f"r/{subreddit} returned status {response.status_code}")
+                return []
+
+            return self._parse_posts(orjson.loads(response.content), subreddit, locality_filter, min_text_length)
+
+        except httpx.TimeoutException:
+            logger.warning(f"Timeout on r/{subreddit}")
+            return []
+        except Exception as e:
+            logger.warning(f"Error on r/{subreddit}: {e}")
+            return []
+
+    async def search_all_async(self, locality, city, subreddits=None, max_posts=None):
+        """
+        Fetch every subreddit over a single HTTP/2 client, so the requests
+        multiplex over one connection instead of a TLS handshake each.
+        With max_posts, outstanding requests are cancelled once enough
+        relevant posts are in.
+        """
+        import httpx
         subreddits = subreddits or DEFAULT_SUBREDDITS
-        all_posts = []
-        seen_ids = set()
-
-        for template in QUERY_TEMPLATES:
-            query = template.format(locality=locality, city=city)
-            for subreddit in subreddits:
-                for post in self.search_subreddit(subreddit, query):
-                    if post['id'] and post['id'] not in seen_ids:
-                        seen_ids.add(post['id'])
-                        all_posts.append(post)
-
-        logger.info(f"Collected {len(all_posts)} raw posts for '{locality}, {city}'")
+        posts_by_id = {}
+
+        query = COMBINED_QUERY.format(locality=locality, city=city)
+        locality_lower = locality.lower()
+
+        async with httpx.AsyncClient(
+            http2=True,
+            headers=HEADERS,
+            timeout=10,
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS),
+        ) as client:
+            tasks = [
+                asyncio.ensure_future(self.search_subreddit_async(
+                    client, subreddit, query, SEARCH_LIMIT,
+                    locality_filter=locality_lower
+                ))
+                for subreddit in self._search_targets(subreddits)
+            ]
+            for next_done in asyncio.as_completed(tasks):
+                self._merge_posts(posts_by_id, await next_done)
+                if max_posts and len(posts_by_id) >= max_posts * EARLY_STOP_HEADROOM:
+                    break
+
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        all_posts = list(posts_by_id.values())
+        logger.info(f"Collected {len(all_posts)} relevant posts for '{locality}, {city}'")
         return all_posts
 
-    def filter_relevant_posts(self, posts, locality, min_text_length=20):
+    def search_all(self, locality, city, subreddits=None, max_posts=None):
+        """
+        Search every subreddit, deduplicating posts as they arrive.
+
+        Uncached collectors take the async HTTP/2 path (search_all_async);
+        cached ones — the default — use the threaded path, since responses
+        fetched with httpx can't be stored in the requests-cache store.
+        Called from inside a running event loop, where asyncio.run() would
+        raise, the threaded path is used too; async callers can await
+        search_all_async directly instead.
+        """
+        if not isinstance(self.session, requests_cache.CachedSession) and not _in_event_loop():
+            return asyncio.run(self.search_all_async(locality, city, subreddits, max_posts))
+
+        subreddits = subreddits or DEFAULT_SUBREDDITS
+        posts_by_id = {}
+
+        query = COMBINED_QUERY.format(locality=locality, city=city)
         locality_lower = locality.lower()
-        filtered = [
-            p for p in posts
-            if locality_lower in p.get('text', '').lower()
-            and len(p.get('text', '')) >= min_text_length
-        ]
+
+        stop_event = threading.Event()
+        self.warm_up()
+
+        # Requests are I/O-bound — run them concurrently, dedup as they arrive,
+        # keeping the higher-scored copy if a post comes back more than once.
+        # With max_posts, stop once there's enough headroom to pick the top from.
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(
+                    self.search_subreddit, subreddit, query, SEARCH_LIMIT,
+                    locality_filter=locality_lower, stop_event=stop_event
+                )
+                for subreddit in self._search_targets(subreddits)
+            ]
+            for future in as_completed(futures):
+                self._merge_posts(posts_by_id, future.result())
+                if max_posts and len(posts_by_id) >= max_posts * EARLY_STOP_HEADROOM:
+                    stop_event.set()
+                    for pending in futures:
+                        pending.cancel()
+                    break
+
+        all_posts = list(posts_by_id.values())
+        logger.info(f"Collected {len(all_posts)} relevant posts for '{locality}, {city}'")
+        return all_posts
+
+    def filter_relevant_posts(self, posts, locality, min_text_length=20, locality_variants=None):
+        """
+        Keep posts that mention locality and are at least min_text_length long.
+        search_all already applies this; it's kept for callers with unfiltered posts,
+        which may be RedditPost objects or plain post dicts ('text' key).
+
+        locality_variants adds spellings that also count as a mention
+        (e.g. "koramangla"); they're checked against each post's lowercased text.
+
+        locality may also be a list of names/variants for batch jobs — each
+        post then gets one LocalityMatcher scan, and its hits are stored in
+        RedditPost.localities (a sorted 'localities' list for dict posts).
+        """
+        filtered = []
+        if isinstance(locality, str):
+            variants = tuple({locality.lower(), *(v.lower() for v in locality_variants or ())})
+            for p in posts:
+                text, text_lower = _post_text(p)
+                if len(text) < min_text_length:
+                    continue
+                if any(v in text_lower for v in variants):
+                    filtered.append(p)
+        else:
+            matcher = LocalityMatcher(locality)
+            for p in posts:
+                text, text_lower = _post_text(p)
+                if len(text) < min_text_length:
+                    continue
+                hits = matcher.find(text_lower)
+                if hits:
+                    if isinstance(p, dict):
+                        filtered.append({**p, 'localities': sorted(hits)})
+                    else:
+                        filtered.append(replace(p, localities=frozenset(hits)))
+
         logger.info(f"Filtered to {len(filtered)} relevant posts")
         return filtered
 
     def collect(self, locality, city, max_posts=100):
-        raw = self.search_all(locality, city)
-        relevant = self.filter_relevant_posts(raw, locality)
-        relevant.sort(key=lambda p: p.get('score', 0), reverse=True)
-        return relevant[:max_posts]
+        relevant = self.search_all(locality, city, max_posts=max_posts)
+        return heapq.nlargest(max_posts, relevant, key=lambda p: p.score)
+
+
+def _post_text(post):
+    """(text, lowercased text) of a RedditPost or a plain post dict."""
+    if isinstance(post, dict):
+        text = post.get('text', '')
+        return text, text.lower()
+    return post.text, post.text_lower
+
+
+def _in_event_loop():
+    """True when called from code running inside an asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=1)
+def _get_collector():
+    """
+    Shared collector, so repeat calls reuse its HTTP connection pool and
+    response cache instead of rebuilding the session each time.
+    """
+    return RedditCollector()
 
 
 def collect_reddit_sentiment(locality, city, reddit_credentials=None, max_posts=100):
@@ -131,5 +505,6 @@ def collect_reddit_sentiment(locality, city, reddit_credentials=None, max_posts=
     Convenience function — no credentials needed in this version.
     reddit_credentials param kept for future API compatibility.
     """
-    collector = RedditCollector()
-    return collector.collect(locality, city, max_posts=max_posts)
\ No newline at end of file
+    collector = _get_collector()
+    # Downstream analysis works on plain dicts
+    return [p.to_dict() for p in collector.collect(locality, city, max_posts=max_posts)]
\ No newline at end of file
@@ -0,0 +1,172 @@
+"""
+Compound-only VADER
+Same scoring rules as vaderSentiment's polarity_scores, restructured for the
+one number the sentiment component actually uses.
+
+The stock implementation re-lowercases the whole token list for every
+negation/idiom check (quadratic in text length), rebuilds the text one
+character at a time while swapping out emojis, and always computes
+pos/neu/neg. Here tokens are lowercased once per text, the emoji pass is
+skipped when there are none, and only the compound score is produced.
+"""
+
+from vaderSentiment.vaderSentiment import (
+    BOOSTER_DICT, C_INCR, N_SCALAR, NEGATE, SPECIAL_CASES,
+    SentimentIntensityAnalyzer, SentiText, normalize, scalar_inc_dec,
+)
+from typing import List
+
+_NEGATE = frozenset(NEGATE)
+
+
+def _negated(word_lower: str) -> bool:
+    """vaderSentiment.negated() for a single, already-lowercased word."""
+    return word_lower in _NEGATE or "n't" in word_lower
+
+
+def _negation_check(valence: float, lower: List[str], start_i: int, i: int) -> float:
+    if start_i == 0:
+        if _negated(lower[i - 1]):
+            valence = valence * N_SCALAR
+    if start_i == 1:
+        if lower[i - 2] == "never" and (lower[i - 1] == "so" or lower[i - 1] == "this"):
+            valence = valence * 1.25
+        elif lower[i - 2] == "without" and lower[i - 1] == "doubt":
+            pass
+        elif _negated(lower[i - 2]):
+            valence = valence * N_SCALAR
+    if start_i == 2:
+        if lower[i - 3] == "never" and (lower[i - 2] == "so" or lower[i - 2] == "this") or \
+                (lower[i - 1] == "so" or lower[i - 1] == "this"):
+            valence = valence * 1.25
+        elif lower[i - 3] == "without" and (lower[i - 2] == "doubt" or lower[i - 1] == "doubt"):
+            pass
+        elif _negated(lower[i - 3]):
+            valence = valence * N_SCALAR
+    return valence
+
+
+def _special_idioms_check(valence: float, lower: List[str], i: int) -> float:
+    onezero = f"{lower[i - 1]} {lower[i]}"
+    twoonezero = f"{lower[i - 2]} {lower[i - 1]} {lower[i]}"
+    twoone = f"{lower[i - 2]} {lower[i - 1]}"
+    threetwoone = f"{lower[i - 3]} {lower[i - 2]} {lower[i - 1]}"
+    threetwo = f"{lower[i - 3]} {lower[i - 2]}"
+
+    for seq in (onezero, twoonezero, twoone, threetwoone, threetwo):
+        if seq in SPECIAL_CASES:
+            valence = SPECIAL_CASES[seq]
+            break
+
+    if len(lower) - 1 > i:
+        zeroone = f"{lower[i]} {lower[i + 1]}"
+        if zeroone in SPECIAL_CASES:
+            valence = SPECIAL_CASES[zeroone]
+    if len(lower) - 1 > i + 1:
+        zeroonetwo = f"{lower[i]} {lower[i + 1]} {lower[i + 2]}"
+        if zeroonetwo in SPECIAL_CASES:
+            valence = SPECIAL_CASES[zeroonetwo]
+
+    # booster/dampener bi-grams such as 'sort of' or 'kind of'
+    for n_gram in (threetwoone, threetwo, twoone):
+        if n_gram in BOOSTER_DICT:
+            valence = valence + BOOSTER_DICT[n_gram]
+    return valence
+
+
+class CompoundVader(SentimentIntensityAnalyzer):
+    """
+    SentimentIntensityAnalyzer with a compound() fast path.
+    polarity_scores() is inherited unchanged for callers that need all four scores.
+    """
+
+    def _replace_emojis(self, text: str) -> str:
+        if self.emojis.keys().isdisjoint(text):
+            return text
+        parts = []
+        prev_space = True
+        for char in text:
+            if char in self.emojis:
+                if not prev_space:
+                    parts.append(' ')
+                parts.append(self.emojis[char])
+                prev_space = False
+            else:
+                parts.append(char)
+                prev_space = char == ' '
+        return ''.join(parts)
+
+    def compound(self, text: str) -> float:
+        """polarity_scores(text)['compound'], without the other three scores."""
+        text = self._replace_emojis(text).strip()
+
+        sentitext = SentiText(text)
+        words = sentitext.words_and_emoticons
+        lower = [w.lower() for w in words]
+        is_cap_diff = sentitext.is_cap_diff
+        lexicon = self.lexicon
+        n = len(words)
+
+        sentiments = []
+        for i, item_lower in enumerate(lower):
+            valence = 0
+            # vader_lexicon words used as modifiers or negations carry no valence
+            if item_lower in BOOSTER_DICT or (
+                    i < n - 1 and item_lower == "kind" and lower[i + 1] == "of"):
+                sentiments.append(valence)
+                continue
+
+            if item_lower in lexicon:
+                valence = lexicon[item_lower]
+
+                # "no" as negation of an adjacent lexicon item vs. a lexicon item of its own
+                if item_lower == "no" and i != n - 1 and lower[i + 1] in lexicon:
+                    valence = 0.0
+                if (i > 0 and lower[i - 1] == "no") \
+                        or (i > 1 and lower[i - 2] == "no") \
+                        or (i > 2 and lower[i - 3] == "no" and lower[i - 1] in ("or", "nor")):
+                    valence = lexicon[item_lower] * N_SCALAR
+
+                # sentiment-laden word in ALL CAPS (while others aren't)
+                if words[i].isupper() and is_cap_diff:
+                    if valence > 0:
+                        valence += C_INCR
+                    else:
+                        valence -= C_INCR
+
+                for start_i in range(0, 3):
+                    # dampen preceding modifiers by their distance from the item
+                    if i > start_i and lower[i - (start_i + 1)] not in lexicon:
+                        s = scalar_inc_dec(words[i - (start_i + 1)], valence, is_cap_diff)
+                        if start_i == 1 and s != 0:
+                            s = s * 0.95
+                        if start_i == 2 and s != 0:
+                            s = s * 0.9
+                        valence = valence + s
+                        valence = _negation_check(valence, lower, start_i, i)
+                        if start_i == 2:
+                            valence = _special_idioms_check(valence, lower, i)
+
+                # negation using "least"
+                if i > 1 and lower[i - 1] not in lexicon and lower[i - 1] == "least":
+                    if lower[i - 2] != "at" and lower[i - 2] != "very":
+                        valence = valence * N_SCALAR
+                elif i > 0 and lower[i - 1] not in lexicon and lower[i - 1] == "least":
+                    valence = valence * N_SCALAR
+
+            sentiments.append(valence)
+
+        if 'but' in lower:
+            sentiments = self._but_check(words, sentiments)
+
+        if not sentiments:
+            return 0.0
+
+        sum_s = float(sum(sentiments))
+        punct_emph_amplifier = self._punctuation_emphasis(text)
+        if sum_s > 0:
+            sum_s += punct_emph_amplifier
+        elif sum_s < 0:
+            sum_s -= punct_emph_amplifier
+
+        return round(normalize(sum_s), 4)
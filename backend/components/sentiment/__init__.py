@@ -9,6 +9,7 @@ Main entry point: get_sentiment_score()
 Files:
     analyzer.py   — VADER analysis logic (SentimentAnalyzer)
     collector.py  — Reddit API data collection (RedditCollector)
+    vader.py      — compound-only VADER scoring (CompoundVader)
 """
 
 from .Analyzer import SentimentAnalyzer, analyze_locality_sentiment
@@ -112,8 +113,7 @@ def get_detailed_sentiment(
             'insights': ["No community data found — defaulted to neutral score"],
         }
 
-    analyzed = analyzer.analyze_posts(posts)
-    score, metrics = analyzer.calculate_score(analyzed)
+    score, metrics = analyzer.calculate_score_arrays(analyzer.analyze_posts_arrays(posts))
     insights = analyzer.generate_insights(score, metrics)
 
     return {
@@ -5,9 +5,11 @@ A Python-based system to evaluate localities for real estate investment
 
 import pandas as pd
 import numpy as np
-from datetime import datetime
-from typing import Dict, List, Tuple
-import json
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+import orjson
 
 # ============================================================================
 # CONFIGURATION
@@ -24,6 +26,9 @@ WEIGHTS = {
     'crime': 0.02
 }
 
+if not np.isclose(sum(WEIGHTS.values()), 1.0):
+    raise ValueError(f"WEIGHTS must sum to 1.0, got {sum(WEIGHTS.values())}")
+
 # Scoring thresholds
 RECOMMENDATION_THRESHOLDS = {
     'buy': {'score': 75, 'confidence': 70},
@@ -31,11 +36,116 @@ RECOMMENDATION_THRESHOLDS = {
     'avoid': {'score': 0, 'confidence': 0}
 }
 
+# Recommendation decision table, shared by the scalar and batch paths:
+# the first (recommendation, thresholds, reasoning) rule met wins
+RECOMMENDATION_RULES = [
+    ('BUY', RECOMMENDATION_THRESHOLDS['buy'], "Strong fundamentals and positive trends"),
+    ('HOLD', RECOMMENDATION_THRESHOLDS['hold'], "Decent potential but monitor trends"),
+]
+DEFAULT_RECOMMENDATION = ('AVOID', "Weak fundamentals or insufficient data")
+
+# Safety rules: a BUY drops to HOLD when the component scores below the
+# threshold (only while the component is weighted, if the flag is set)
+BUY_DOWNGRADES = [
+    ('crime', 30, " (downgraded due to crime concerns)", True),
+    ('real_estate', 20, " (downgraded due to negative real estate trends)", False),
+]
+
+# Categorical lookups shared by the scalar and batch scorers
+CONNECTIVITY_SCORES = {
+    'excellent': 25,
+    'good': 15,
+    'average': 10,
+    'poor': 0
+}
+
+SHOPPING_SCORES = {
+    'high': 20,
+    'medium': 10,
+    'low': 5
+}
+
+TRACK_RECORD_SCORES = {
+    'excellent': 30,
+    'good': 20,
+    'average': 10,
+    'poor': 0
+}
+
+PROJECT_VALUES = {
+    'metro': 40,
+    'airport': 40,
+    'it_park': 30,
+    'sez': 30,
+    'highway': 25,
+    'smart_city': 20
+}
+
+TIMELINE_MULTIPLIERS = {
+    'construction': 1.5,
+    'under_construction': 1.5,
+    '2_years': 1.2,
+    'within_2_years': 1.2,
+    '5_years': 1.0,
+    '2_5_years': 1.0,
+    'beyond': 0.7,
+    'beyond_5_years': 0.7
+}
+
+AMENITY_CATEGORIES = {
+    'restaurants_2km': ('Restaurants', 20, 5),
+    'gyms_2km': ('Fitness facilities', 20, 3),
+    'parks_2km': ('Parks/recreation', 20, 2),
+    'entertainment_2km': ('Entertainment', 20, 2),
+    'markets_2km': ('Markets/groceries', 20, 3)
+}
+
+CRIME_SCORES = {
+    'much_below': 100,
+    'below_average': 75,
+    'below': 75,
+    'average': 50,
+    'above_average': 25,
+    'above': 25,
+    'much_above': 0
+}
+
+# Threshold ladders as (bins, points, side): the value's bin index picks its
+# points. side='right' reproduces `x < bin` / `x >= bin` ladders, side='left'
+# reproduces `x > bin` / `x <= bin` ladders. Shared by scalar and batch scorers.
+_METRO_BINS = ((1, 3, 5), (25, 15, 5, 0), 'right')
+_HOSPITAL_BINS = ((1, 2, 3), (0, 5, 10, 15), 'right')
+_SCHOOL_BINS = ((1, 3, 5), (0, 5, 10, 15), 'right')
+_APPRECIATION_BINS = ((0, 5, 10, 15), (0, 10, 20, 25, 30), 'left')
+_RENTAL_YIELD_BINS = ((2, 3, 4), (10, 15, 20, 25), 'left')
+_TURNOVER_BINS = ((90, 180, 365), (20, 15, 10, 5), 'right')
+_PRICE_RATIO_BINS = ((0.9, 1.1), (25, 15, 5), 'right')
+_DEVELOPER_COUNT_BINS = ((1, 2, 3), (0, 15, 25, 40), 'right')
+_DELIVERY_BINS = ((60, 80), (10, 20, 30), 'left')
+_FRESHNESS_BINS = ((30, 90), (30, 20, 10), 'left')
+_SAMPLE_SIZE_BINS = ((20, 50, 100), (5, 10, 15, 20), 'right')
+
+
+def _ladder(value, bins_spec: Tuple) -> Tuple[int, int]:
+    """Return (bin index, points) for value — a bisect in place of an if/elif ladder."""
+    bins, points, side = bins_spec
+    idx = (bisect_right if side == 'right' else bisect_left)(bins, value)
+    return idx, points[idx]
+
 # ============================================================================
 # SCORING FUNCTIONS
 # ============================================================================
 
-def calculate_sentiment_score(sentiment_data: Dict) -> Tuple[float, List[str]]:
+# Insights are (template, args) pairs, formatted only when a report shows them
+Insight = Tuple[str, tuple]
+
+
+def format_insights(insights: List[Insight]) -> List[str]:
+    """Render (template, args) insights to strings."""
+    return [template.format(*args) for template, args in insights]
+
+
+def calculate_sentiment_score(sentiment_data: Dict) -> Tuple[float, List[Insight]]:
     """
     Calculate sentiment score from user comments/posts
     
@@ -58,10 +168,10 @@ def calculate_sentiment_score(sentiment_data: Dict) -> Tuple[float, List[str]]:
     mention_count = sentiment_data.get('mention_count', 0)
     if mention_count > 500:
         base_score = min(100, base_score + 10)
-        insights.append(f"High user engagement ({mention_count} mentions)")
+        insights.append(("High user engagement ({} mentions)", (mention_count,)))
     elif mention_count > 100:
         base_score = min(100, base_score + 5)
-        insights.append(f"Good user engagement ({mention_count} mentions)")
+        insights.append(("Good user engagement ({} mentions)", (mention_count,)))
     
     # Recency adjustment (weight recent sentiment 2x)
     recent = sentiment_data.get('recent_sentiment', sentiment_data.get('avg_sentiment', 0))
@@ -69,12 +179,12 @@ def calculate_sentiment_score(sentiment_data: Dict) -> Tuple[float, List[str]]:
     final_score = ((weighted_sentiment + 1) / 2) * 100
     
     if sentiment_data.get('recent_sentiment', 0) > sentiment_data.get('avg_sentiment', 0):
-        insights.append("Improving sentiment trend")
+        insights.append(("Improving sentiment trend", ()))
     
     return round(final_score, 2), insights
 
 
-def calculate_infrastructure_score(infra_data: Dict) -> Tuple[float, List[str]]:
+def calculate_infrastructure_score(infra_data: Dict) -> Tuple[float, List[Insight]]:
     """
     Calculate infrastructure score
     
@@ -92,20 +202,18 @@ def calculate_infrastructure_score(infra_data: Dict) -> Tuple[float, List[str]]:
     
     # Metro proximity (25 pts max)
     metro_dist = infra_data.get('metro_distance_km', 999)
-    if metro_dist < 1:
-        score += 25
-        insights.append(f"Excellent metro connectivity ({metro_dist:.1f}km)")
-    elif metro_dist < 3:
-        score += 15
-        insights.append(f"Good metro connectivity ({metro_dist:.1f}km)")
-    elif metro_dist < 5:
-        score += 5
+    band, points = _ladder(metro_dist, _METRO_BINS)
+    score += points
+    if band == 0:
+        insights.append(("Excellent metro connectivity ({:.1f}km)", (metro_dist,)))
+    elif band == 1:
+        insights.append(("Good metro connectivity ({:.1f}km)", (metro_dist,)))
     
     # Hospitals (15 pts max)
     hospitals = infra_data.get('hospitals_5km', 0)
     if hospitals >= 3:
         score += 15
-        insights.append(f"Multiple hospitals nearby ({hospitals})")
+        insights.append(("Multiple hospitals nearby ({})", (hospitals,)))
     elif hospitals == 2:
         score += 10
     elif hospitals == 1:
@@ -113,39 +221,25 @@ def calculate_infrastructure_score(infra_data: Dict) -> Tuple[float, List[str]]:
     
     # Schools (15 pts max)
     schools = infra_data.get('schools_3km', 0)
-    if schools >= 5:
-        score += 15
-        insights.append(f"Good educational infrastructure ({schools} schools)")
-    elif schools >= 3:
-        score += 10
-    elif schools >= 1:
-        score += 5
+    band, points = _ladder(schools, _SCHOOL_BINS)
+    score += points
+    if band == 3:
+        insights.append(("Good educational infrastructure ({} schools)", (schools,)))
     
     # Connectivity (25 pts max)
-    connectivity_scores = {
-        'excellent': 25,
-        'good': 15,
-        'average': 10,
-        'poor': 0
-    }
     conn = infra_data.get('connectivity', 'average').lower()
-    score += connectivity_scores.get(conn, 10)
+    score += CONNECTIVITY_SCORES.get(conn, 10)
     if conn == 'excellent':
-        insights.append("Excellent road connectivity")
+        insights.append(("Excellent road connectivity", ()))
     
     # Shopping density (20 pts max)
-    shopping_scores = {
-        'high': 20,
-        'medium': 10,
-        'low': 5
-    }
     shopping = infra_data.get('shopping_density', 'medium').lower()
-    score += shopping_scores.get(shopping, 10)
+    score += SHOPPING_SCORES.get(shopping, 10)
     
     return round(score, 2), insights
 
 
-def calculate_real_estate_score(re_data: Dict) -> Tuple[float, List[str]]:
+def calculate_real_estate_score(re_data: Dict) -> Tuple[float, List[Insight]]:
     """
     Calculate real estate trends score
     
@@ -163,59 +257,44 @@ def calculate_real_estate_score(re_data: Dict) -> Tuple[float, List[str]]:
     
     # Price appreciation (30 pts max)
     appreciation = re_data.get('price_appreciation_yoy', 0)
-    if appreciation > 15:
-        score += 30
-        insights.append(f"Strong price appreciation ({appreciation:.1f}% YoY)")
-    elif appreciation > 10:
-        score += 25
-        insights.append(f"Good price appreciation ({appreciation:.1f}% YoY)")
-    elif appreciation > 5:
-        score += 20
-    elif appreciation > 0:
-        score += 10
-    else:
+    band, points = _ladder(appreciation, _APPRECIATION_BINS)
+    score += points
+    if band == 4:
+        insights.append(("Strong price appreciation ({:.1f}% YoY)", (appreciation,)))
+    elif band == 3:
+        insights.append(("Good price appreciation ({:.1f}% YoY)", (appreciation,)))
+    elif band == 0:
         risks.append(f"Negative price growth ({appreciation:.1f}% YoY)")
     
     # Rental yield (25 pts max)
     rental_yield = re_data.get('rental_yield', 0)
-    if rental_yield > 4:
-        score += 25
-        insights.append(f"Excellent rental yield ({rental_yield:.1f}%)")
-    elif rental_yield > 3:
-        score += 20
-    elif rental_yield > 2:
-        score += 15
-    else:
-        score += 10
+    band, points = _ladder(rental_yield, _RENTAL_YIELD_BINS)
+    score += points
+    if band == 3:
+        insights.append(("Excellent rental yield ({:.1f}%)", (rental_yield,)))
     
     # Inventory turnover (20 pts max)
     turnover = re_data.get('inventory_turnover_days', 365)
-    if turnover < 90:
-        score += 20
-        insights.append("High demand (quick inventory turnover)")
-    elif turnover < 180:
-        score += 15
-    elif turnover < 365:
-        score += 10
-    else:
-        score += 5
+    band, points = _ladder(turnover, _TURNOVER_BINS)
+    score += points
+    if band == 0:
+        insights.append(("High demand (quick inventory turnover)", ()))
+    elif band == 3:
         risks.append("Slow inventory movement")
     
     # Price competitiveness (25 pts max)
     price_ratio = re_data.get('price_vs_city_avg', 1.0)
-    if price_ratio < 0.9:
-        score += 25
-        insights.append("Below city average pricing")
-    elif price_ratio < 1.1:
-        score += 15
-    else:
-        score += 5
+    band, points = _ladder(price_ratio, _PRICE_RATIO_BINS)
+    score += points
+    if band == 0:
+        insights.append(("Below city average pricing", ()))
+    elif band == 2:
         risks.append("Above city average pricing")
     
     return round(score, 2), insights, risks
 
 
-def calculate_developer_score(dev_data: Dict) -> Tuple[float, List[str]]:
+def calculate_developer_score(dev_data: Dict) -> Tuple[float, List[Insight]]:
     """
     Calculate developer presence score
     
@@ -233,36 +312,27 @@ def calculate_developer_score(dev_data: Dict) -> Tuple[float, List[str]]:
     dev_count = dev_data.get('reputed_developer_count', 0)
     if dev_count >= 3:
         score += 40
-        insights.append(f"Strong developer presence ({dev_count} reputed brands)")
+        insights.append(("Strong developer presence ({} reputed brands)", (dev_count,)))
     elif dev_count == 2:
         score += 25
     elif dev_count == 1:
         score += 15
     
     # Track record (30 pts max)
-    track_record_scores = {
-        'excellent': 30,
-        'good': 20,
-        'average': 10,
-        'poor': 0
-    }
     track = dev_data.get('track_record', 'average').lower()
-    score += track_record_scores.get(track, 10)
+    score += TRACK_RECORD_SCORES.get(track, 10)
     
     # On-time delivery (30 pts max)
     delivery_rate = dev_data.get('on_time_delivery_rate', 0)
-    if delivery_rate > 80:
-        score += 30
-        insights.append(f"Reliable delivery track record ({delivery_rate:.0f}%)")
-    elif delivery_rate > 60:
-        score += 20
-    else:
-        score += 10
+    band, points = _ladder(delivery_rate, _DELIVERY_BINS)
+    score += points
+    if band == 2:
+        insights.append(("Reliable delivery track record ({:.0f}%)", (delivery_rate,)))
     
     return round(score, 2), insights
 
 
-def calculate_projects_score(projects_data: Dict) -> Tuple[float, List[str]]:
+def calculate_projects_score(projects_data: Dict) -> Tuple[float, List[Insight]]:
     """
     Calculate major projects score
     
@@ -277,40 +347,18 @@ def calculate_projects_score(projects_data: Dict) -> Tuple[float, List[str]]:
     score = 0
     insights = []
     
-    # Project values
-    project_values = {
-        'metro': 40,
-        'airport': 40,
-        'it_park': 30,
-        'sez': 30,
-        'highway': 25,
-        'smart_city': 20
-    }
-    
-    # Timeline multipliers
-    timeline_multipliers = {
-        'construction': 1.5,
-        'under_construction': 1.5,
-        '2_years': 1.2,
-        'within_2_years': 1.2,
-        '5_years': 1.0,
-        '2_5_years': 1.0,
-        'beyond': 0.7,
-        'beyond_5_years': 0.7
-    }
-    
-    for project_type, value in project_values.items():
+    for project_type, value in PROJECT_VALUES.items():
         if project_type in projects_data:
             project = projects_data[project_type]
             count = project.get('count', 0)
             timeline = project.get('timeline', '5_years').lower()
             
             if count > 0:
-                multiplier = timeline_multipliers.get(timeline, 1.0)
+                multiplier = TIMELINE_MULTIPLIERS.get(timeline, 1.0)
                 project_score = min(value, value * count * 0.7) * multiplier
                 score += project_score
                 
-                insights.append(f"{project_type.replace('_', ' ').title()} planned ({timeline.replace('_', ' ')})")
+                insights.append(("{} planned ({})", (project_type.replace('_', ' ').title(), timeline.replace('_', ' '))))
     
     # Cap at 100
     score = min(100, score)
@@ -318,7 +366,7 @@ def calculate_projects_score(projects_data: Dict) -> Tuple[float, List[str]]:
     return round(score, 2), insights
 
 
-def calculate_amenities_score(amenities_data: Dict) -> Tuple[float, List[str]]:
+def calculate_amenities_score(amenities_data: Dict) -> Tuple[float, List[Insight]]:
     """
     Calculate amenities score
     
@@ -334,26 +382,18 @@ def calculate_amenities_score(amenities_data: Dict) -> Tuple[float, List[str]]:
     score = 0
     insights = []
     
-    categories = {
-        'restaurants_2km': ('Restaurants', 20, 5),
-        'gyms_2km': ('Fitness facilities', 20, 3),
-        'parks_2km': ('Parks/recreation', 20, 2),
-        'entertainment_2km': ('Entertainment', 20, 2),
-        'markets_2km': ('Markets/groceries', 20, 3)
-    }
-    
-    for key, (name, max_points, divisor) in categories.items():
+    for key, (name, max_points, divisor) in AMENITY_CATEGORIES.items():
         count = amenities_data.get(key, 0)
         points = min(max_points, count / divisor)
         score += points
         
         if count >= divisor * 3:
-            insights.append(f"Good {name.lower()} availability")
+            insights.append(("Good {} availability", (name.lower(),)))
     
     return round(score, 2), insights
 
 
-def calculate_crime_score(crime_data: Dict) -> Tuple[float, List[str]]:
+def calculate_crime_score(crime_data: Dict) -> Tuple[float, List[Insight]]:
     """
     Calculate crime score
     
@@ -362,24 +402,14 @@ def calculate_crime_score(crime_data: Dict) -> Tuple[float, List[str]]:
             'comparison': 'much_below'|'below'|'average'|'above'|'much_above'
         }
     """
-    score_map = {
-        'much_below': 100,
-        'below_average': 75,
-        'below': 75,
-        'average': 50,
-        'above_average': 25,
-        'above': 25,
-        'much_above': 0
-    }
-    
     comparison = crime_data.get('comparison', 'average').lower()
-    score = score_map.get(comparison, 50)
+    score = CRIME_SCORES.get(comparison, 50)
     
     insights = []
     if score >= 75:
-        insights.append("Low crime rate")
+        insights.append(("Low crime rate", ()))
     elif score <= 25:
-        insights.append("Higher than average crime rate")
+        insights.append(("Higher than average crime rate", ()))
     
     return round(score, 2), insights
 
@@ -400,33 +430,28 @@ def calculate_confidence(data_meta: Dict) -> float:
             'sentiment_sample_size': int
         }
     """
+    return _confidence_cached(
+        data_meta.get('data_freshness_days', 365),
+        data_meta.get('data_completeness', 0.5),
+        data_meta.get('source_reliability', 0.7),
+        data_meta.get('sentiment_sample_size', 0),
+    )
+
+
+@lru_cache(maxsize=2048)
+def _confidence_cached(freshness_days, completeness, reliability, sample_size) -> float:
+    """calculate_confidence on hashable fields — batches repeat the same meta a lot."""
     # Data freshness (0-30 pts)
-    freshness_days = data_meta.get('data_freshness_days', 365)
-    if freshness_days <= 30:
-        freshness_score = 30
-    elif freshness_days <= 90:
-        freshness_score = 20
-    else:
-        freshness_score = 10
+    freshness_score = _ladder(freshness_days, _FRESHNESS_BINS)[1]
     
     # Data completeness (0-30 pts)
-    completeness = data_meta.get('data_completeness', 0.5)
     completeness_score = completeness * 30
     
     # Source reliability (0-20 pts)
-    reliability = data_meta.get('source_reliability', 0.7)
     reliability_score = reliability * 20
     
     # Sample size (0-20 pts)
-    sample_size = data_meta.get('sentiment_sample_size', 0)
-    if sample_size >= 100:
-        sample_score = 20
-    elif sample_size >= 50:
-        sample_score = 15
-    elif sample_size >= 20:
-        sample_score = 10
-    else:
-        sample_score = 5
+    sample_score = _ladder(sample_size, _SAMPLE_SIZE_BINS)[1]
     
     confidence = freshness_score + completeness_score + reliability_score + sample_score
     
@@ -437,93 +462,73 @@ def calculate_confidence(data_meta: Dict) -> float:
 # MAIN RATING FUNCTION
 # ============================================================================
 
-def rate_locality(locality_name: str, data: Dict) -> Dict:
+# (component, scorer, whether the scorer also returns risks), in report order
+_SCORERS = [
+    ('sentiment', calculate_sentiment_score, False),
+    ('infrastructure', calculate_infrastructure_score, False),
+    ('real_estate', calculate_real_estate_score, True),
+    ('developers', calculate_developer_score, False),
+    ('projects', calculate_projects_score, False),
+    ('amenities', calculate_amenities_score, False),
+    ('crime', calculate_crime_score, False),
+]
+
+
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string, e.g. '2024-05-01T12:00:00Z'."""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def rate_locality(locality_name: str, data: Dict, timestamp: Optional[str] = None) -> Dict:
     """
     Main function to rate a locality
     
     Args:
         locality_name: Name of the locality
         data: All collected data for the locality
+        timestamp: Report timestamp — pass one shared utc_timestamp() when
+                   rating many localities; defaults to now
     
     Returns:
         Complete rating report
     """
     # Calculate component scores
-    sentiment_score, sentiment_insights = calculate_sentiment_score(
-        data.get('sentiment', {})
-    )
-    
-    infra_score, infra_insights = calculate_infrastructure_score(
-        data.get('infrastructure', {})
-    )
-    
-    re_score, re_insights, re_risks = calculate_real_estate_score(
-        data.get('real_estate', {})
-    )
-    
-    dev_score, dev_insights = calculate_developer_score(
-        data.get('developers', {})
-    )
-    
-    projects_score, projects_insights = calculate_projects_score(
-        data.get('projects', {})
-    )
-    
-    amenities_score, amenities_insights = calculate_amenities_score(
-        data.get('amenities', {})
-    )
-    
-    crime_score, crime_insights = calculate_crime_score(
-        data.get('crime', {})
-    )
-    
-    # Store component scores
-    component_scores = {
-        'sentiment': sentiment_score,
-        'infrastructure': infra_score,
-        'real_estate': re_score,
-        'developers': dev_score,
-        'projects': projects_score,
-        'amenities': amenities_score,
-        'crime': crime_score
-    }
-    
-    # Calculate weighted final score
+    component_scores = {}
+    all_insights = []
+    re_risks = []
+    for key, scorer, returns_risks in _SCORERS:
+        result = scorer(data.get(key, {}))
+        if returns_risks:
+            score, insights, re_risks = result
+        else:
+            score, insights = result
+        component_scores[key] = score
+        all_insights.extend(insights)
+    
+    # Calculate weighted final score — summed in WEIGHTS order, which
+    # rate_localities_batch repeats so both round the same way
     final_score = sum(
-        component_scores[key] * WEIGHTS[key] 
-        for key in WEIGHTS.keys()
+        component_scores[key] * WEIGHTS[key]
+        for key in WEIGHTS
     )
     
     # Calculate confidence
     confidence = calculate_confidence(data.get('meta', {}))
     
     # Determine recommendation
-    if final_score >= 75 and confidence >= 70:
-        recommendation = "BUY"
-        reasoning = "Strong fundamentals and positive trends"
-    elif final_score >= 60 and confidence >= 60:
-        recommendation = "HOLD"
-        reasoning = "Decent potential but monitor trends"
-    else:
-        recommendation = "AVOID"
-        reasoning = "Weak fundamentals or insufficient data"
+    recommendation, reasoning = DEFAULT_RECOMMENDATION
+    for rec, thresholds, rec_reasoning in RECOMMENDATION_RULES:
+        if final_score >= thresholds['score'] and confidence >= thresholds['confidence']:
+            recommendation, reasoning = rec, rec_reasoning
+            break
     
     # Apply safety rules
-    if crime_score < 30 and WEIGHTS.get('crime', 0) > 0:
-        if recommendation == "BUY":
+    for component, threshold, note, needs_weight in BUY_DOWNGRADES:
+        if needs_weight and not WEIGHTS.get(component, 0) > 0:
+            continue
+        if recommendation == "BUY" and component_scores[component] < threshold:
             recommendation = "HOLD"
-            reasoning += " (downgraded due to crime concerns)"
-    
-    if re_score < 20:
-        if recommendation == "BUY":
-            recommendation = "HOLD"
-            reasoning += " (downgraded due to negative real estate trends)"
-    
-    # Compile all insights
-    all_insights = (
-        sentiment_insights + infra_insights + re_insights + 
-        dev_insights + projects_insights + amenities_insights + crime_insights
-    )
+            reasoning += note
     
     # Compile report
     report = {
@@ -534,15 +539,244 @@ def rate_locality(locality_name: str, data: Dict) -> Dict:
         'recommendation': recommendation,
         'reasoning': reasoning,
         'component_scores': component_scores,
-        'key_insights': all_insights[:10],  # Top 10 insights
+        'key_insights': format_insights(all_insights[:10]),  # Top 10 insights
         'risks': re_risks if re_risks else [],
         'weights_used': WEIGHTS,
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': timestamp or utc_timestamp(),
     }
     
     return report
 
 
+# ============================================================================
+# BATCH SCORING
+# ============================================================================
+# Vectorized equivalents of the calculate_*_score functions. Each threshold
+# ladder is looked up with np.searchsorted over the same (bins, points, side)
+# specs the scalar scorers use, so a whole DataFrame of localities is scored
+# in one pass.
+# Insights are not generated here — call the scalar functions for the rows
+# you actually display.
+
+def _col(df: pd.DataFrame, name: str, default) -> np.ndarray:
+    """Column as a NumPy array, with missing column / NaN cells set to default."""
+    if name not in df:
+        return np.full(len(df), default)
+    return df[name].fillna(default).to_numpy()
+
+
+def _bin_points(values: np.ndarray, bins_spec: Tuple) -> np.ndarray:
+    """Look up ladder points for every value in one searchsorted call."""
+    bins, points, side = bins_spec
+    return np.asarray(points)[np.searchsorted(bins, values, side=side)]
+
+
+def _round2(values: np.ndarray) -> np.ndarray:
+    """
+    Round to 2 decimals, matching the builtin round() the scalar path uses.
+
+    np.round scales by 100 first, so it can only disagree with round() when
+    value * 100 sits right at a .5 tie. Those few elements are re-rounded
+    with round(); everything else keeps the vectorized result. (Rounding
+    every element in Python cost more than the rest of rate_localities_batch.)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    rounded = np.round(values, 2)
+    scaled = values * 100
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for i in np.flatnonzero(near_tie):
+        rounded[i] = round(float(values[i]), 2)
+    return rounded
+
+
+def _map_col(df: pd.DataFrame, name: str, default: str, mapping: Dict, fallback) -> np.ndarray:
+    """Map a categorical (case-insensitive) column through a score dict."""
+    if name not in df:
+        return np.full(len(df), mapping.get(default, fallback), dtype=np.float64)
+    labels = df[name].fillna(default).astype(str).str.lower()
+    return labels.map(mapping).fillna(fallback).to_numpy(dtype=np.float64)
+
+
+_PROJECT_VALUE_VEC = np.fromiter(PROJECT_VALUES.values(), dtype=np.float64, count=len(PROJECT_VALUES))
+
+
+def _project_scores(counts: np.ndarray, mults: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    calculate_projects_score for a whole batch.
+
+    Args:
+        counts: (n, k) project counts, one column per PROJECT_VALUES type
+        mults: (n, k) timeline multipliers
+        values: (k,) max value of each project type
+
+    Returns:
+        (n,) project scores, capped at 100
+    """
+    per_type = np.minimum(values, values * counts * 0.7) * mults
+    return np.minimum(100, np.where(counts > 0, per_type, 0.0).sum(axis=1))
+
+
+def localities_to_frame(localities: Dict[str, Dict]) -> pd.DataFrame:
+    """
+    Flatten per-locality data dicts (as passed to rate_locality) into one
+    DataFrame row per locality, as expected by rate_localities_batch.
+
+    Component fields become columns by name ('metro_distance_km', ...);
+    projects become '<type>_count' / '<type>_timeline'; meta fields are kept.
+    """
+    rows = {}
+    for name, data in localities.items():
+        row = {}
+        for component in ('sentiment', 'infrastructure', 'real_estate',
+                          'developers', 'amenities', 'crime', 'meta'):
+            row.update(data.get(component, {}))
+        for project_type, project in data.get('projects', {}).items():
+            row[f'{project_type}_count'] = project.get('count', 0)
+            row[f'{project_type}_timeline'] = project.get('timeline', '5_years')
+        rows[name] = row
+    return pd.DataFrame.from_dict(rows, orient='index')
+
+
+def calculate_confidence_batch(meta_df: pd.DataFrame) -> np.ndarray:
+    """
+    calculate_confidence for many localities at once.
+
+    Args:
+        meta_df: One row per locality with the data_meta fields as columns
+                 (missing columns/cells take calculate_confidence's defaults)
+
+    Returns:
+        Confidence per row, rounded to 2 decimals
+    """
+    confidence = (
+        _bin_points(_col(meta_df, 'data_freshness_days', 365), _FRESHNESS_BINS) +
+        _col(meta_df, 'data_completeness', 0.5).astype(np.float64) * 30 +
+        _col(meta_df, 'source_reliability', 0.7).astype(np.float64) * 20 +
+        _bin_points(_col(meta_df, 'sentiment_sample_size', 0), _SAMPLE_SIZE_BINS)
+    )
+    return _round2(confidence)
+
+
+def rate_localities_batch(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Score many localities at once — vectorized rate_locality scoring.
+
+    Args:
+        df: One row per locality (index = locality name), columns as produced
+            by localities_to_frame(). Missing columns/cells take the same
+            defaults as the scalar scorers.
+
+    Returns:
+        DataFrame with one column per component score plus 'final_score',
+        'confidence', 'recommendation' and 'reasoning'
+    """
+    scores = {}
+
+    # Sentiment — recent sentiment weighted 2x, defaults to the average
+    avg = _col(df, 'avg_sentiment', 0).astype(np.float64)
+    recent = _col(df, 'recent_sentiment', np.nan).astype(np.float64)
+    recent = np.where(np.isnan(recent), avg, recent)
+    scores['sentiment'] = (((avg + 2 * recent) / 3) + 1) / 2 * 100
+
+    # Infrastructure
+    scores['infrastructure'] = (
+        _bin_points(_col(df, 'metro_distance_km', 999), _METRO_BINS) +
+        _bin_points(_col(df, 'hospitals_5km', 0), _HOSPITAL_BINS) +
+        _bin_points(_col(df, 'schools_3km', 0), _SCHOOL_BINS) +
+        _map_col(df, 'connectivity', 'average', CONNECTIVITY_SCORES, 10) +
+        _map_col(df, 'shopping_density', 'medium', SHOPPING_SCORES, 10)
+    )
+
+    # Real estate
+    scores['real_estate'] = (
+        _bin_points(_col(df, 'price_appreciation_yoy', 0), _APPRECIATION_BINS) +
+        _bin_points(_col(df, 'rental_yield', 0), _RENTAL_YIELD_BINS) +
+        _bin_points(_col(df, 'inventory_turnover_days', 365), _TURNOVER_BINS) +
+        _bin_points(_col(df, 'price_vs_city_avg', 1.0), _PRICE_RATIO_BINS)
+    )
+
+    # Developers
+    scores['developers'] = (
+        _bin_points(_col(df, 'reputed_developer_count', 0), _DEVELOPER_COUNT_BINS) +
+        _map_col(df, 'track_record', 'average', TRACK_RECORD_SCORES, 10) +
+        _bin_points(_col(df, 'on_time_delivery_rate', 0), _DELIVERY_BINS)
+    )
+
+    # Projects — (n_localities, n_project_types) matrices, scored in one kernel call
+    counts = np.column_stack([
+        _col(df, f'{project_type}_count', 0).astype(np.float64)
+        for project_type in PROJECT_VALUES
+    ])
+    mults = np.column_stack([
+        _map_col(df, f'{project_type}_timeline', '5_years', TIMELINE_MULTIPLIERS, 1.0)
+        for project_type in PROJECT_VALUES
+    ])
+    scores['projects'] = _project_scores(counts, mults, _PROJECT_VALUE_VEC)
+
+    # Amenities
+    amenities = np.zeros(len(df))
+    for key, (_, max_points, divisor) in AMENITY_CATEGORIES.items():
+        amenities += np.minimum(max_points, _col(df, key, 0) / divisor)
+    scores['amenities'] = amenities
+
+    # Crime
+    scores['crime'] = _map_col(df, 'comparison', 'average', CRIME_SCORES, 50)
+
+    result = pd.DataFrame(
+        {key: _round2(value) for key, value in scores.items()},
+        index=df.index
+    )
+    # Same term order as rate_locality, so float rounding matches row for row
+    final_score = sum(result[key].to_numpy() * weight for key, weight in WEIGHTS.items())
+    confidence = calculate_confidence_batch(df)
+    result['final_score'] = _round2(final_score)
+    result['confidence'] = confidence
+
+    # Recommendation — the decision table as masks, unrounded score as in rate_locality
+    rule_masks = [
+        (final_score >= thresholds['score']) & (confidence >= thresholds['confidence'])
+        for _, thresholds, _ in RECOMMENDATION_RULES
+    ]
+    recommendation = np.select(
+        rule_masks, [rec for rec, _, _ in RECOMMENDATION_RULES], DEFAULT_RECOMMENDATION[0]
+    ).astype(object)
+    reasoning = np.select(
+        rule_masks, [reason for _, _, reason in RECOMMENDATION_RULES], DEFAULT_RECOMMENDATION[1]
+    ).astype(object)
+
+    for component, threshold, note, needs_weight in BUY_DOWNGRADES:
+        if needs_weight and not WEIGHTS.get(component, 0) > 0:
+            continue
+        downgrade = (recommendation == "BUY") & (result[component].to_numpy() < threshold)
+        recommendation[downgrade] = "HOLD"
+        reasoning[downgrade] = reasoning[downgrade] + note
+
+    result['recommendation'] = recommendation
+    result['reasoning'] = reasoning
+
+    return result
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def save_reports_jsonl(reports: Iterable[Dict], path: str) -> int:
+    """
+    Write rating reports as JSON Lines — one compact report per line through
+    a single file handle, for batch runs over many localities.
+
+    Returns:
+        Number of reports written
+    """
+    count = 0
+    with open(path, 'wb') as f:
+        for report in reports:
+            f.write(orjson.dumps(report, option=orjson.OPT_APPEND_NEWLINE, default=str))
+            count += 1
+    return count
+
+
 # ============================================================================
 # EXAMPLE USAGE
 # ============================================================================
@@ -627,7 +861,7 @@ if __name__ == "__main__":
     print("\n" + "="*70)
     
     # Save to JSON
-    with open('example_rating_output.json', 'w') as f:
-        json.dump(report, f, indent=2)
+    with open('example_rating_output.json', 'wb') as f:
+        f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE, default=str))
     
     print("\nReport saved to: example_rating_output.json")
@@ -5,8 +5,10 @@ Just edit the locality name and run!
 
 from data_collection_guide import collect_all_data, load_config
 from locality_rating_system import rate_locality
-import json
+import io
+import orjson
 import os
+import sys
 
 # ============================================================================
 # ✏️  EDIT THESE TWO LINES TO ANALYZE ANY LOCALITY
@@ -19,6 +21,14 @@ CITY = "DELHI"
 # Don't edit anything below this line (unless you know what you're doing!)
 # ============================================================================
 
+# Score bars, indexed by int(score / 5) — 20 bars max
+BARS = tuple("█" * i + "░" * (20 - i) for i in range(21))
+
+# Padded component labels for the score table
+COMPONENTS = ('sentiment', 'infrastructure', 'real_estate', 'developers', 'projects', 'amenities', 'crime')
+TITLES = {c: c.title().ljust(20) for c in COMPONENTS}
+
+
 def main():
     print("\n" + "="*70)
     print("🏘️  LOCALITY RATING SYSTEM")
@@ -52,13 +62,15 @@ def main():
         print("\n📊 Calculating rating...")
         report = rate_locality(f"{LOCALITY}, {CITY}", data)
         
-        # Display results
-        print("\n" + "="*70)
-        print("📋 LOCALITY RATING REPORT: {}".format(report['locality']))
-        print("="*70)
+        # Display results — built in one buffer and written at once
+        buf = io.StringIO()
+        w = buf.write
+        w("\n" + "="*70 + "\n")
+        w("📋 LOCALITY RATING REPORT: {}\n".format(report['locality']))
+        w("="*70 + "\n")
         
-        print(f"\n🎯 Final Score: {report['final_score']}/100")
-        print(f"💪 Confidence: {report['confidence']}% ({report['confidence_level']})")
+        w(f"\n🎯 Final Score: {report['final_score']}/100\n")
+        w(f"💪 Confidence: {report['confidence']}% ({report['confidence_level']})\n")
         
         # Color-coded recommendation
         rec = report['recommendation']
@@ -69,45 +81,48 @@ def main():
         else:
             emoji = "❌"
         
-        print(f"\n{emoji} RECOMMENDATION: {rec}")
-        print(f"💡 Reasoning: {report['reasoning']}")
+        w(f"\n{emoji} RECOMMENDATION: {rec}\n")
+        w(f"💡 Reasoning: {report['reasoning']}\n")
         
-        print(f"\n📊 Component Scores:")
-        print("-" * 50)
+        w("\n📊 Component Scores:\n")
+        w("-" * 50 + "\n")
         for component, score in report['component_scores'].items():
-            # Visual bar
-            bars = int(score / 5)  # 20 bars max
-            bar_visual = "█" * bars + "░" * (20 - bars)
-            print(f"{component.title():<20} {bar_visual} {score:>5.1f}/100")
+            title = TITLES.get(component) or component.title().ljust(20)
+            w(f"{title} {BARS[max(0, min(20, int(score / 5)))]} {score:>5.1f}/100\n")
         
-        print(f"\n✨ Key Insights:")
-        print("-" * 50)
+        w("\n✨ Key Insights:\n")
+        w("-" * 50 + "\n")
         for i, insight in enumerate(report['key_insights'], 1):
-            print(f"  {i}. {insight}")
+            w(f"  {i}. {insight}\n")
         
         if report.get('risks'):
-            print(f"\n⚠️  Risks/Concerns:")
-            print("-" * 50)
+            w("\n⚠️  Risks/Concerns:\n")
+            w("-" * 50 + "\n")
             for i, risk in enumerate(report['risks'], 1):
-                print(f"  {i}. {risk}")
+                w(f"  {i}. {risk}\n")
+        
+        sys.stdout.write(buf.getvalue())
         
         # Save to file
         filename = f"{LOCALITY}_{CITY}_report.json".replace(" ", "_")
-        with open(filename, 'w') as f:
-            json.dump(report, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
         
-        print("\n" + "="*70)
-        print(f"💾 Full report saved to: {filename}")
-        print("="*70)
-        print("\n🎉 Analysis complete!")
+        buf = io.StringIO()
+        w = buf.write
+        w("\n" + "="*70 + "\n")
+        w(f"💾 Full report saved to: {filename}\n")
+        w("="*70 + "\n")
+        w("\n🎉 Analysis complete!\n")
         
         # Tips
-        print("\n💡 What to do next:")
-        print("   • Open the JSON file to see all details")
-        print("   • Compare with other localities")
-        print("   • Add manual real estate data for better accuracy")
-        print("   • Share results with friends/family")
-        print("")
+        w("\n💡 What to do next:\n")
+        w("   • Open the JSON file to see all details\n")
+        w("   • Compare with other localities\n")
+        w("   • Add manual real estate data for better accuracy\n")
+        w("   • Share results with friends/family\n")
+        w("\n")
+        sys.stdout.write(buf.getvalue())
         
     except FileNotFoundError as e:
         print(f"\n❌ ERROR: {e}")
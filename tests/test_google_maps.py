@@ -0,0 +1,41 @@
+"""
+Google Maps wrapper tests — the client is stubbed, nothing hits the network.
+
+Run from the project root:
+    python -m unittest discover tests
+"""
+
+import unittest
+
+from backend.components.infrastructure.google_maps import GoogleMapsAPI
+
+
+def _place(name, lat, lng):
+    return {'name': name, 'place_id': name, 'geometry': {'location': {'lat': lat, 'lng': lng}}}
+
+
+class FindNearbyPlacesMultiTest(unittest.TestCase):
+
+    def setUp(self):
+        self.maps = GoogleMapsAPI('AIza-test-key', cache_path=None)
+
+    def test_failing_type_only_loses_its_own_results(self):
+        def places_nearby(location, radius, type):
+            if type == 'hospital':
+                return {'results': [{'name': 'no geometry'}]}   # KeyError while parsing
+            if type == 'school':
+                raise ValueError('bad response')
+            return {'results': [_place(f'{type}-1', 12.97, 77.59)]}
+
+        self.maps.client.places_nearby = places_nearby
+        results = self.maps.find_nearby_places_multi(
+            12.97, 77.59, {'hospital': 5000, 'school': 3000, 'bank': 2000}
+        )
+
+        self.assertEqual(results['hospital'], [])
+        self.assertEqual(results['school'], [])
+        self.assertEqual([p['name'] for p in results['bank']], ['bank-1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Infrastructure scorer tests.
+
+Run from the project root:
+    python -m unittest discover tests
+"""
+
+import random
+import unittest
+
+from backend.components.infrastructure.calculator import INFRASTRUCTURE_TYPES
+from backend.components.infrastructure.scorer import InfrastructureScorer
+
+
+def _infra_data(rng=None):
+    """One entry per infra type; all-empty unless an rng is given."""
+    data = {}
+    for infra_type in INFRASTRUCTURE_TYPES:
+        if rng is None or rng.random() < 0.3:
+            data[infra_type] = {'nearest_distance_m': None, 'count_in_radius': 0}
+        else:
+            data[infra_type] = {
+                'nearest_distance_m': rng.choice([100.0, 500.0, 1500.0, 4000.0]),
+                'count_in_radius': rng.randint(0, 6),
+            }
+    return data
+
+
+class GenerateInsightsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.scorer = InfrastructureScorer(maps_api=None)
+
+    def _insights(self, data):
+        scores = self.scorer.score_all(data)
+        return self.scorer.generate_insights(scores, data, self.scorer.calculate_final_score(scores))
+
+    def test_tied_weaknesses_follow_stable_descending_sort(self):
+        # Every category scores 0 — the weakest pair is the last two in dict order
+        insights = self._insights(_infra_data())
+        types = list(INFRASTRUCTURE_TYPES)
+        self.assertEqual(insights[1:3], [
+            f"Strong {types[0]} access: 0 options, nearest at unknown distance",
+            f"Strong {types[1]} access: 0 options, nearest at unknown distance",
+        ])
+        self.assertEqual(insights[3:], [
+            f"Limited {types[-2]} access: none found nearby",
+            f"Limited {types[-1]} access: none found nearby",
+        ])
+
+    def test_partial_ties_at_both_ends(self):
+        scores = {
+            name: {'score': score, 'nearest_distance_m': None, 'count_in_radius': 0}
+            for name, score in [('a', 10), ('b', 90), ('c', 10), ('d', 10), ('e', 90), ('f', 90)]
+        }
+        insights = self.scorer.generate_insights(scores, {}, 50.0)
+        # Stable descending sort: b, e, f, a, c, d
+        self.assertEqual([i.split(':')[0] for i in insights[1:]], [
+            'Strong b access', 'Strong e access', 'Limited c access', 'Limited d access'
+        ])
+
+    def test_highlights_match_full_sort(self):
+        rng = random.Random(0)
+        for _ in range(300):
+            data = _infra_data(rng)
+            scores = self.scorer.score_all(data)
+            ranked = sorted(scores.items(), key=lambda x: x[1]['score'], reverse=True)
+            expected = [f"Strong {t} access" for t, _ in ranked[:2]]
+            expected += [f"Limited {t} access" for t, s in ranked[-2:] if s['score'] < 50]
+
+            insights = self._insights(data)[1:]
+            self.assertEqual([i.split(':')[0] for i in insights], expected[:len(insights)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+"""
+Maps cache tests.
+
+Run from the project root:
+    python -m unittest discover tests
+"""
+
+import os
+import tempfile
+import unittest
+
+from backend.components.infrastructure.cache import MapsCache
+
+
+class MemoryLayerTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = MapsCache('key', path=os.path.join(self._tmp.name, 'maps'), memory_size=3)
+
+    def tearDown(self):
+        self.cache._db.close()
+        self._tmp.cleanup()
+
+    def test_memory_layer_is_bounded(self):
+        for i in range(10):
+            self.cache.set(self.cache.make_key('k', i), i)
+        self.assertEqual(len(self.cache._memory), 3)
+
+    def test_least_recently_used_is_evicted(self):
+        keys = [self.cache.make_key('k', i) for i in range(3)]
+        for i, key in enumerate(keys):
+            self.cache.set(key, i)
+        self.cache.get(keys[0])
+        self.cache.set(self.cache.make_key('k', 3), 3)
+        self.assertNotIn(keys[1], self.cache._memory)
+        self.assertIn(keys[0], self.cache._memory)
+
+    def test_evicted_entries_still_come_from_disk(self):
+        for i in range(10):
+            self.cache.set(self.cache.make_key('k', i), i)
+        self.assertEqual(self.cache.get(self.cache.make_key('k', 0)), 0)
+        self.assertEqual(len(self.cache._memory), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
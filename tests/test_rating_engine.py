@@ -0,0 +1,104 @@
+"""
+Rating engine tests — the vectorized batch path must agree with rate_locality.
+
+Run from the project root:
+    python -m unittest discover tests
+"""
+
+import random
+import unittest
+
+import numpy as np
+
+from backend.core.rating_engine import (
+    _round2, localities_to_frame, rate_localities_batch, rate_locality
+)
+
+PROJECT_TYPES = ('metro', 'airport', 'it_park', 'sez', 'highway', 'smart_city', 'other')
+AMENITY_KEYS = ('restaurants_2km', 'gyms_2km', 'parks_2km', 'entertainment_2km', 'markets_2km')
+
+
+def _random_locality(rng):
+    """Locality data with ~15% of fields missing and some unknown labels."""
+    def fields(**choices):
+        return {k: pick() for k, pick in choices.items() if rng.random() < 0.85}
+
+    projects = {}
+    for project_type in PROJECT_TYPES:
+        if rng.random() < 0.4:
+            projects[project_type] = fields(
+                count=lambda: rng.randint(0, 3),
+                timeline=lambda: rng.choice(['construction', '2_years', '5_years', 'beyond',
+                                             'Under_Construction', 'unknown']),
+            )
+
+    return {
+        'sentiment': fields(
+            avg_sentiment=lambda: rng.uniform(-1, 1),
+            mention_count=lambda: rng.randint(0, 900),
+            recent_sentiment=lambda: rng.uniform(-1, 1),
+        ),
+        'infrastructure': fields(
+            metro_distance_km=lambda: rng.choice([0.5, 1, 2.9, 3, 4, 5, 7, rng.uniform(0, 8)]),
+            hospitals_5km=lambda: rng.randint(0, 5),
+            schools_3km=lambda: rng.randint(0, 8),
+            connectivity=lambda: rng.choice(['Excellent', 'good', 'average', 'poor', 'unknown']),
+            shopping_density=lambda: rng.choice(['high', 'Medium', 'low', 'unknown']),
+        ),
+        'real_estate': fields(
+            price_appreciation_yoy=lambda: rng.choice([-2, 0, 5, 10, 15, rng.uniform(-5, 20)]),
+            rental_yield=lambda: rng.choice([2, 3, 4, rng.uniform(0, 6)]),
+            inventory_turnover_days=lambda: rng.choice([89, 90, 180, 365, 400, rng.randint(0, 500)]),
+            price_vs_city_avg=lambda: rng.choice([0.9, 1.1, rng.uniform(0.5, 1.5)]),
+        ),
+        'developers': fields(
+            reputed_developer_count=lambda: rng.randint(0, 5),
+            track_record=lambda: rng.choice(['excellent', 'good', 'average', 'poor', 'unknown']),
+            on_time_delivery_rate=lambda: rng.choice([60, 80, rng.uniform(0, 100)]),
+        ),
+        'projects': projects,
+        'amenities': fields(**{key: (lambda: rng.randint(0, 100)) for key in AMENITY_KEYS}),
+        'crime': fields(
+            comparison=lambda: rng.choice(['much_below', 'below', 'average', 'above',
+                                           'much_above', 'BELOW_AVERAGE', 'unknown']),
+        ),
+        'meta': fields(
+            data_freshness_days=lambda: rng.choice([10, 30, 31, 90, 91, 400]),
+            data_completeness=rng.random,
+            source_reliability=rng.random,
+            sentiment_sample_size=lambda: rng.choice([0, 19, 20, 50, 100, 300]),
+        ),
+    }
+
+
+class BatchMatchesScalarTest(unittest.TestCase):
+
+    def test_random_localities(self):
+        rng = random.Random(0)
+        localities = {f'L{i}': _random_locality(rng) for i in range(3000)}
+        batch = rate_localities_batch(localities_to_frame(localities))
+
+        for name, data in localities.items():
+            report = rate_locality(name, data)
+            row = batch.loc[name]
+            with self.subTest(locality=name):
+                for component, score in report['component_scores'].items():
+                    self.assertEqual(row[component], score, component)
+                for column in ('final_score', 'confidence', 'recommendation', 'reasoning'):
+                    self.assertEqual(row[column], report[column], column)
+
+
+class Round2Test(unittest.TestCase):
+
+    def test_matches_builtin_round_including_ties(self):
+        rng = np.random.default_rng(0)
+        values = np.concatenate([
+            rng.random(20000) * 100,
+            np.arange(0, 100, 0.005),                   # every .xx5 decimal tie
+            np.round(rng.random(20000) * 100, 3),
+        ])
+        self.assertEqual(_round2(values).tolist(), [round(v, 2) for v in values.tolist()])
+
+
+if __name__ == '__main__':
+    unittest.main()
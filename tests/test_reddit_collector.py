@@ -0,0 +1,138 @@
+"""
+Reddit collector tests — no network; requests stop at a recording adapter.
+
+Run from the project root:
+    python -m unittest discover tests
+"""
+
+import asyncio
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+import orjson
+
+from backend.components.sentiment.Collector import RedditCollector, RedditPost
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Answers every request with a 200 JSON body and remembers what it saw."""
+
+    def __init__(self, payload=None):
+        super().__init__()
+        self.sent = []
+        self.body = json.dumps(payload or {}).encode()
+
+    def send(self, request, **kwargs):
+        self.sent.append((request.method, request.url))
+        raw = HTTPResponse(
+            body=io.BytesIO(self.body), status=200, headers={'Content-Type': 'application/json'},
+            request_url=request.url, preload_content=False,
+        )
+        return self.build_response(request, raw)
+
+
+class WarmUpTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_name = os.path.join(self._tmp.name, 'reddit_cache')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _collector(self, adapter):
+        collector = RedditCollector(cache_name=self.cache_name)
+        collector.session.mount('https://', adapter)
+        return collector
+
+    def test_warm_up_reaches_the_adapter_on_every_run(self):
+        for _ in range(2):
+            adapter = RecordingAdapter()
+            self._collector(adapter).warm_up()
+            # A second collector sharing the cache must still hit the network
+            self.assertEqual(adapter.sent, [('HEAD', 'https://www.reddit.com/')])
+
+    def test_warm_up_runs_once_per_collector(self):
+        adapter = RecordingAdapter()
+        collector = self._collector(adapter)
+        collector.warm_up()
+        collector.warm_up()
+        self.assertEqual(len(adapter.sent), 1)
+
+
+class SearchAllTest(unittest.TestCase):
+
+    LISTING = {'data': {'children': [{'data': {
+        'id': 'abc', 'title': 'Living in Koramangala', 'selftext': 'Great cafes, bad traffic',
+        'score': 10, 'created_utc': 1.0, 'permalink': '/r/bangalore/abc', 'subreddit': 'bangalore',
+    }}]}}
+
+    def test_inside_running_event_loop_uses_threaded_path(self):
+        collector = RedditCollector(cache_name=None)
+        adapter = RecordingAdapter(self.LISTING)
+        collector.session.mount('https://', adapter)
+        collector.rate_limiter.wait = lambda: None
+
+        async def handler():
+            # An async web handler calling the sync API must not hit asyncio.run()
+            return collector.search_all('Koramangala', 'Bangalore', subreddits=['bangalore'])
+
+        posts = asyncio.run(handler())
+        self.assertEqual([p.id for p in posts], ['abc'])
+        self.assertIn('GET', [method for method, _ in adapter.sent])
+
+
+class RedditPostTest(unittest.TestCase):
+
+    def test_to_dict_has_original_keys_and_serializes(self):
+        post = RedditPost(
+            id='abc', text='Living in Koramangala', text_lower='living in koramangala',
+            score=10, created_utc=1.0, url='https://reddit.com/r/bangalore/abc',
+            subreddit='bangalore', num_comments=2, localities=frozenset({'koramangala'}),
+        )
+        exported = post.to_dict()
+        self.assertEqual(
+            set(exported), {'id', 'text', 'score', 'created_utc', 'url', 'subreddit', 'num_comments'}
+        )
+        self.assertEqual(orjson.loads(orjson.dumps(exported)), exported)
+
+
+class FilterRelevantPostsTest(unittest.TestCase):
+
+    TEXTS = ('Living in Koramangala is great', 'Koramangla traffic is bad today',
+             'Nothing about the area here', 'HSR Layout vs Koramangala rents', 'short')
+
+    def setUp(self):
+        self.collector = RedditCollector(cache_name=None)
+
+    def _post(self, i, text):
+        return RedditPost(
+            id=str(i), text=text, text_lower=text.lower(), score=i, created_utc=0.0,
+            url='', subreddit='bangalore', num_comments=0,
+        )
+
+    def test_dict_and_dataclass_posts_agree(self):
+        dicts = [{'id': str(i), 'text': t} for i, t in enumerate(self.TEXTS)]
+        posts = [self._post(i, t) for i, t in enumerate(self.TEXTS)]
+        kwargs = dict(locality='Koramangala', locality_variants=['koramangla'])
+
+        kept_dicts = self.collector.filter_relevant_posts(dicts, **kwargs)
+        kept_posts = self.collector.filter_relevant_posts(posts, **kwargs)
+        self.assertEqual([d['id'] for d in kept_dicts], ['0', '1', '3'])
+        self.assertEqual([p.id for p in kept_posts], ['0', '1', '3'])
+
+    def test_multi_locality_dict_posts(self):
+        dicts = [{'id': str(i), 'text': t} for i, t in enumerate(self.TEXTS)]
+        kept = self.collector.filter_relevant_posts(dicts, locality=['koramangala', 'hsr layout'])
+        self.assertEqual([(d['id'], d['localities']) for d in kept],
+                         [('0', ['koramangala']), ('3', ['hsr layout', 'koramangala'])])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+Sentiment analyzer tests — calculate_score must reproduce the original
+list-based metrics, including which posts count as "recent" on tied timestamps.
+
+Run from the project root:
+    python -m unittest discover tests
+"""
+
+import random
+import unittest
+
+from backend.components.sentiment.Analyzer import SentimentAnalyzer
+
+
+def _reference_score(analyzed_posts):
+    """The original pure-Python calculate_score."""
+    compounds = [p['sentiment']['compound'] for p in analyzed_posts]
+    upvotes = [max(p.get('score', 1), 1) for p in analyzed_posts]
+
+    avg_sentiment = sum(compounds) / len(compounds)
+    weighted_sentiment = sum(c * w for c, w in zip(compounds, upvotes)) / sum(upvotes)
+
+    sorted_posts = sorted(analyzed_posts, key=lambda p: p.get('created_utc', 0))
+    recent_cutoff = max(1, int(len(sorted_posts) * 0.7))
+    recent_posts = sorted_posts[recent_cutoff:]
+    recent_sentiment = (
+        sum(p['sentiment']['compound'] for p in recent_posts) / len(recent_posts)
+        if recent_posts else avg_sentiment
+    )
+
+    if recent_sentiment > avg_sentiment + 0.05:
+        trend = 'improving'
+    elif recent_sentiment < avg_sentiment - 0.05:
+        trend = 'declining'
+    else:
+        trend = 'stable'
+
+    score = (weighted_sentiment + 1) / 2 * 90 + 5
+    return round(max(0.0, min(100.0, score)), 2), {
+        'avg_sentiment': round(avg_sentiment, 4),
+        'weighted_sentiment': round(weighted_sentiment, 4),
+        'recent_sentiment': round(recent_sentiment, 4),
+        'mention_count': len(analyzed_posts),
+        'trend': trend,
+    }
+
+
+class CalculateScoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.analyzer = SentimentAnalyzer()
+
+    def test_tied_and_missing_timestamps(self):
+        rng = random.Random(0)
+        for _ in range(2000):
+            posts = [
+                {'sentiment': {'compound': round(rng.uniform(-1, 1), 4)}, 'score': rng.randint(-5, 300)}
+                for _ in range(rng.randint(1, 400))
+            ]
+            for post in posts:
+                if rng.random() < 0.8:   # the rest default to 0
+                    post['created_utc'] = rng.randint(0, 5)
+            self.assertEqual(self.analyzer.calculate_score(posts), _reference_score(posts))
+
+    def test_all_timestamps_equal_keeps_input_order(self):
+        posts = [{'sentiment': {'compound': c}, 'score': 1, 'created_utc': 7}
+                 for c in (-1.0, -1.0, -1.0, -1.0, -1.0, -1.0, -1.0, 1.0, 1.0, 1.0)]
+        _, metrics = self.analyzer.calculate_score(posts)
+        self.assertEqual(metrics['recent_sentiment'], 1.0)
+        self.assertEqual(metrics['trend'], 'improving')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+Spatial index tests — radius queries must match a brute-force Haversine scan.
+
+Run from the project root:
+    python -m unittest discover tests
+"""
+
+import random
+import unittest
+
+import numpy as np
+
+from backend.components.infrastructure.calculator import ProximityCalculator
+from backend.components.infrastructure.spatial_index import PlaceIndex
+
+
+def _brute_force(places, lat, lng, radius_m):
+    lats, lngs = ProximityCalculator.place_coordinates(places)
+    dists = ProximityCalculator.haversine_vector(lat, lng, lats, lngs)
+    return set(np.flatnonzero(dists <= radius_m).tolist())
+
+
+class QueryRadiusTest(unittest.TestCase):
+
+    def _check(self, places, queries):
+        index = PlaceIndex(places)
+        for lat, lng, radius_m in queries:
+            hits, _ = index.query_radius(lat, lng, radius_m)
+            self.assertEqual(set(hits.tolist()), _brute_force(places, lat, lng, radius_m),
+                             (lat, lng, radius_m))
+
+    def test_global_random(self):
+        rng = random.Random(0)
+        places = [{'lat': rng.uniform(-90, 90), 'lng': rng.uniform(-180, 180)} for _ in range(2000)]
+        queries = [
+            (rng.uniform(-90, 90), rng.uniform(-180, 180), rng.choice([1e3, 1e5, 1e6, 5e6, 2e7, 3e7]))
+            for _ in range(1000)
+        ]
+        self._check(places, queries)
+
+    def test_antimeridian(self):
+        places = [{'lat': 0.0, 'lng': 179.99}, {'lat': 0.0, 'lng': -179.99}, {'lat': 0.0, 'lng': 0.0}]
+        self._check(places, [(0.0, 180.0, 5000), (0.0, -179.995, 5000)])
+
+    def test_city_scale(self):
+        rng = random.Random(1)
+        places = [{'lat': 12.97 + rng.uniform(-0.1, 0.1), 'lng': 77.59 + rng.uniform(-0.1, 0.1)}
+                  for _ in range(500)]
+        queries = [(12.97 + rng.uniform(-0.1, 0.1), 77.59 + rng.uniform(-0.1, 0.1),
+                    rng.choice([500, 1000, 2000, 5000])) for _ in range(300)]
+        self._check(places, queries)
+
+    def test_no_places(self):
+        hits, dists = PlaceIndex([]).query_radius(0.0, 0.0, 1000)
+        self.assertEqual(hits.size, 0)
+        self.assertEqual(dists.size, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Compound-only VADER tests — must agree exactly with stock polarity_scores.
+
+Run from the project root:
+    python -m unittest discover tests
+"""
+
+import random
+import unittest
+
+from vaderSentiment.vaderSentiment import (
+    BOOSTER_DICT, NEGATE, SPECIAL_CASES, SentimentIntensityAnalyzer
+)
+
+from backend.components.sentiment.Analyzer import SentimentAnalyzer
+from backend.components.sentiment.Vader import CompoundVader
+
+# Words that trigger every rule: boosters, negations, idioms, "but", "least", caps, emojis
+RULE_WORDS = (
+    'no', 'or', 'nor', 'but', 'least', 'at', 'very', 'kind', 'of', 'never', 'so', 'this',
+    'without', 'doubt', 'cut', 'the', 'mustard', 'sort', 'GOOD', 'Great!!', 'bad?',
+    '😀', '😡', '❤️', ':)', ':(', 'metro', 'traffic', "isn't",
+)
+
+
+def _corpus(stock, size, seed=0):
+    rng = random.Random(seed)
+    vocab = (
+        sorted(stock.lexicon)[::50] + list(BOOSTER_DICT) + list(NEGATE)
+        + [w for case in SPECIAL_CASES for w in case.split()] + list(RULE_WORDS)
+    )
+    texts = ['', '   ', '😀', 'but', 'no no no']
+    for _ in range(size):
+        words = [rng.choice(vocab) for _ in range(rng.randint(0, 40))]
+        words = [w.upper() if rng.random() < 0.1 else w for w in words]
+        texts.append(' '.join(words) + rng.choice(['', '!', '!!!', '?', '??', '????', '.']))
+    return texts
+
+
+class CompoundVaderTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.stock = SentimentIntensityAnalyzer()
+        cls.fast = CompoundVader()
+
+    def test_matches_stock_compound(self):
+        for text in _corpus(self.stock, 3000):
+            self.assertEqual(self.fast.compound(text), self.stock.polarity_scores(text)['compound'], text)
+
+    def test_polarity_scores_unchanged(self):
+        for text in _corpus(self.stock, 200, seed=1):
+            self.assertEqual(self.fast.polarity_scores(text), self.stock.polarity_scores(text))
+
+
+class AnalyzerPathsTest(unittest.TestCase):
+
+    def test_arrays_path_matches_dict_path(self):
+        rng = random.Random(2)
+        texts = _corpus(SentimentIntensityAnalyzer(), 300, seed=2)
+        posts = [
+            {'text': text, 'score': rng.randint(-5, 200), 'created_utc': rng.randint(0, 10**6)}
+            for text in texts
+        ]
+        analyzer = SentimentAnalyzer()
+        self.assertEqual(
+            analyzer.calculate_score(analyzer.analyze_posts(posts)),
+            analyzer.calculate_score_arrays(analyzer.analyze_posts_arrays(posts)),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()